@@ -20,14 +20,25 @@ SDK2経由でGo2を制御するブリッジサーバー
 制限事項:
 - Jetson上でのみ動作
 - unitree_sdk2pyが必要
+- バイナリ(msgpack)配信にはmsgpackが必要（未導入時はJSONのみ）
+- uvloopがあれば自動的に使用（未導入時は標準のイベントループ）
+- orjsonがあればJSONのエンコード/デコードに使用（未導入時は標準のjson）
+- イベントループスレッドのCPU固定・SCHED_FIFO化は環境変数で指定した時のみ有効
+  （GO2_BRIDGE_CPU_CORE / GO2_BRIDGE_RT_PRIORITY、既定は無効）
+- SCHED_FIFO化にはroot権限またはCAP_SYS_NICEが必要
+  （例: sudo setcap cap_sys_nice+ep $(readlink -f $(which python3))）
+  権限がない場合は通常の優先度で動作する
 """
 
 import asyncio
 import json
+import os
+import socket
 import time
 import threading
-from typing import Optional, Dict, Any, Set
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Set, Union
+from dataclasses import dataclass, field
 import struct
 
 # WebSocket
@@ -39,6 +50,27 @@ except ImportError:
     WEBSOCKETS_AVAILABLE = False
     print("[Bridge] websocketsがインストールされていません: pip install websockets")
 
+# orjson（オプション: 高速JSONエンコード/デコード）
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# MessagePack（オプション: バイナリ状態配信）
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# uvloop（オプション: 高速イベントループ）
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Unitree SDK2
 try:
     from unitree_sdk2py.core.channel import ChannelFactory, ChannelType
@@ -60,12 +92,70 @@ HOST = "0.0.0.0"  # すべてのインターフェースでリッスン
 PORT = 8765
 ROBOT_IP = "127.0.0.1"  # Jetsonからはlocalhostで接続
 
+# クライアントごとの送信キュー長（= 送信が追いつかない時にまとめる最大スナップショット数）
+MAX_BATCH_FRAMES = 5
+
+# 1回の送信にかけられる最大時間（秒）。超えたクライアントは切断する
+SEND_TIMEOUT = 0.1
+
+
+
+def _envInt(name: str) -> Optional[int]:
+    """
+    環境変数を整数として読み込む
+
+    Args:
+        name: 環境変数名
+
+    Returns:
+        整数値（未設定・空・不正な値ならNone）
+    """
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        print(f"[Bridge] {name}の値が不正です（無視します）: {value}")
+        return None
+
+
+# イベントループスレッドの固定先CPUとリアルタイム優先度（どちらも既定は無効）
+# ループスレッドはWebSocketの受付・送受信・コマンド処理も担うため、
+# 周期のぶれが問題になる環境で、機種に合わせたコアを明示した時だけ有効にする
+#   GO2_BRIDGE_CPU_CORE=5 GO2_BRIDGE_RT_PRIORITY=10 python3 bridge_server.py
+STATE_CPU_CORE: Optional[int] = _envInt("GO2_BRIDGE_CPU_CORE")
+STATE_RT_PRIORITY: Optional[int] = _envInt("GO2_BRIDGE_RT_PRIORITY")
+
+
+def _jsonDumps(obj: Any) -> str:
+    """
+    JSONを文字列にエンコード（orjsonがあれば使用）
+
+    JSONはテキストフレームで送る（テキストしか扱わないクライアントとの互換のため）。
+    バイナリフレームはmsgpack/バッチ専用
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _jsonLoads(data: Union[str, bytes]) -> Any:
+    """JSONをデコード（orjsonがあれば使用）"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# 事前エンコード済みのPing応答
+PONG_MESSAGE = _jsonDumps({"type": "pong"})
+
 
 # ============================================================================
 # ロボット状態
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RobotState:
     """ロボット状態データ"""
     timestamp: float = 0.0
@@ -85,6 +175,7 @@ class RobotState:
     velocityYaw: float = 0.0
     footContacts: list = None
     footForces: list = None
+    _dict: dict = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.imuGyro is None:
@@ -95,9 +186,35 @@ class RobotState:
             self.footContacts = [False, False, False, False]
         if self.footForces is None:
             self.footForces = [0.0, 0.0, 0.0, 0.0]
+        self._dict = {}
     
     def toDict(self) -> dict:
-        return asdict(self)
+        """
+        配信用の辞書に変換
+        
+        毎回新しい辞書を作らず、保持しているテンプレート辞書を上書きして返す。
+        リストはコピーせずそのまま参照する（配列は呼び出し側でインプレース更新する）。
+        戻り値は次の呼び出しで書き換わるため、エンコード以外の用途で保持しないこと。
+        """
+        d = self._dict
+        d["timestamp"] = self.timestamp
+        d["connected"] = self.connected
+        d["mode"] = self.mode
+        d["batteryLevel"] = self.batteryLevel
+        d["batteryVoltage"] = self.batteryVoltage
+        d["batteryCurrent"] = self.batteryCurrent
+        d["batteryTemperature"] = self.batteryTemperature
+        d["imuRoll"] = self.imuRoll
+        d["imuPitch"] = self.imuPitch
+        d["imuYaw"] = self.imuYaw
+        d["imuGyro"] = self.imuGyro
+        d["imuAccel"] = self.imuAccel
+        d["velocityX"] = self.velocityX
+        d["velocityY"] = self.velocityY
+        d["velocityYaw"] = self.velocityYaw
+        d["footContacts"] = self.footContacts
+        d["footForces"] = self.footForces
+        return d
 
 
 # ============================================================================
@@ -122,8 +239,29 @@ class Go2BridgeServer:
         self.host = host
         self.port = port
         
-        # 接続クライアント
-        self.clients: Set = set()
+        # 接続クライアント（WebSocket → 送信キュー）
+        self.clients: Dict[Any, asyncio.Queue] = {}
+        self._clientList: tuple = ()  # 配信用スナップショット（接続/切断時のみ再構築）
+        self._writers: Dict[Any, asyncio.Task] = {}  # クライアントごとの送信タスク
+        self._clientsPresent = asyncio.Event()  # クライアントが1つ以上接続中
+        self._binaryClients: Set = set()  # msgpack配信を要求したクライアント
+        
+        # メッセージ種別 → 処理
+        self._commands = {
+            "standUp": self._standUp,
+            "standDown": self._standDown,
+            "balanceStand": self._balanceStand,
+            "recoveryStand": self._recoveryStand,
+            "stopMove": self._stopMove,
+            "damp": self._damp,
+            "emergencyStop": self._emergencyStop,
+        }
+        self._requestHandlers = {
+            "move": self._onMove,
+            "getState": self._replyState,
+            "setFormat": self._onSetFormat,
+            "ping": self._replyPong,
+        }
         
         # SDK2クライアント
         self.sportClient: Optional[Any] = None
@@ -132,13 +270,33 @@ class Go2BridgeServer:
         # 状態
         self.state = RobotState()
         self.running = False
+        self._dirty = True  # 前回配信から状態が変化したか
+        self._frameCache: Dict[bool, Union[bytes, str]] = {}  # binary → エンコード済み状態
         
-        # スレッド
-        self.stateThread: Optional[threading.Thread] = None
+        # タスク / スレッド
+        self._stateTask: Optional[asyncio.Task] = None
         self.videoThread: Optional[threading.Thread] = None
         
         # シミュレーションモード
         self.simulationMode = not SDK2_AVAILABLE
+        
+        # シミュレーション波形テーブル: offset + amp * sin(omega * t + phase)
+        # 並び: 電圧, 電流, roll, pitch, yaw [deg], gyro xyz, accel xyz, 足の力 x4
+        # tはエポック秒なのでfloat64のまま計算する（float32では位相が潰れる）
+        halfPi = np.pi / 2
+        self._simOmegas = np.array([
+            0.1, 0.5, 2.0, 1.5, 0.3, 2.0, 1.5, 0.3, 1.0, 1.0, 3.0, 3.0, 3.0, 3.0, 3.0
+        ])
+        self._simPhases = np.array([
+            0.0, 0.0, 0.0, 0.0, 0.0, halfPi, halfPi, halfPi, 0.0, halfPi, 0.0, 0.0, 1.0, 2.0, 3.0
+        ])
+        self._simAmps = np.array([
+            0.5, 1.0, np.degrees(0.05), np.degrees(0.03), np.degrees(0.1),
+            0.1, 0.06, 0.2, 0.5, 0.3, 0.1, 20.0, 20.0, 20.0, 20.0
+        ])
+        self._simOffsets = np.array([
+            25.0, 2.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 9.81, 50.0, 50.0, 50.0, 50.0
+        ])
 
     async def start(self) -> None:
         """サーバーを開始"""
@@ -161,16 +319,89 @@ class Go2BridgeServer:
         if not self.simulationMode:
             self._initSdk2()
         
-        # 状態更新スレッド開始
+        # 状態更新タスク開始（ソケットを所有するこのループ上で実行）
+        if STATE_CPU_CORE is not None or STATE_RT_PRIORITY is not None:
+            # ワーカースレッドはループスレッドの固定・優先度を引き継がないよう、
+            # 固定前の設定に戻すエグゼキューターを先に登録しておく
+            originalAffinity = (
+                os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else None
+            )
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(
+                    thread_name_prefix="bridge-worker",
+                    initializer=self._resetWorkerScheduling,
+                    initargs=(originalAffinity,),
+                )
+            )
+            self._tuneScheduling()
         self.running = True
-        self.stateThread = threading.Thread(target=self._stateLoop, daemon=True)
-        self.stateThread.start()
+        self._stateTask = asyncio.create_task(self._stateLoop())
         
         # WebSocketサーバー開始
-        async with serve(self._handleClient, self.host, self.port):
+        # 20Hzの小さな状態フレームには圧縮が割に合わないためpermessage-deflateは無効
+        # （大きな映像フレームを扱う場合は別エンドポイントで圧縮を有効にする）
+        # write_limitを大きめにして、同じループ周回内の複数フレームを
+        # トランスポートのバッファにまとめてから送信させる（下限は上限の1/4）
+        async with serve(
+            self._handleClient,
+            self.host,
+            self.port,
+            compression=None,
+            max_size=2 ** 20,
+            write_limit=256 * 1024,
+        ):
             print(f"[Bridge] サーバー起動完了 - ws://{self.host}:{self.port}")
             await asyncio.Future()  # 永久に実行
 
+    @staticmethod
+    def _tuneScheduling() -> None:
+        """
+        イベントループスレッドをCPUに固定し、リアルタイム優先度に上げる
+        
+        状態更新はイベントループ上のタスクとして動くため、呼び出し元スレッドに適用する。
+        GO2_BRIDGE_CPU_CORE / GO2_BRIDGE_RT_PRIORITYで指定された項目だけを適用する。
+        Linux以外や権限不足の場合は何もしない。
+        """
+        if STATE_CPU_CORE is not None and hasattr(os, "sched_setaffinity"):
+            if STATE_CPU_CORE < (os.cpu_count() or 0):
+                try:
+                    os.sched_setaffinity(0, {STATE_CPU_CORE})
+                    print(f"[Bridge] CPU{STATE_CPU_CORE}に固定しました")
+                except OSError as e:
+                    print(f"[Bridge] CPU固定に失敗: {e}")
+        
+        if STATE_RT_PRIORITY is not None and hasattr(os, "sched_setscheduler"):
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(STATE_RT_PRIORITY))
+                print(f"[Bridge] SCHED_FIFO (優先度 {STATE_RT_PRIORITY}) で実行します")
+            except PermissionError:
+                print("[Bridge] SCHED_FIFOの設定にはCAP_SYS_NICEが必要です（通常優先度で実行）")
+            except OSError as e:
+                print(f"[Bridge] スケジューラ設定に失敗: {e}")
+
+    @staticmethod
+    def _resetWorkerScheduling(affinity: Optional[Set[int]]) -> None:
+        """
+        ワーカースレッドのCPU固定とリアルタイム優先度を解除
+        
+        asyncio.to_threadのワーカーはループスレッドから生成され設定を引き継ぐため、
+        SDK2読み出しが状態更新と同じコアを取り合わないよう通常スケジューリングに戻す。
+        
+        Args:
+            affinity: 固定前のCPUマスク（取得できない環境ではNone）
+        """
+        if affinity and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, affinity)
+            except OSError as e:
+                print(f"[Bridge] ワーカーのCPU固定解除に失敗: {e}")
+        
+        if hasattr(os, "sched_setscheduler"):
+            try:
+                os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+            except OSError as e:
+                print(f"[Bridge] ワーカーのスケジューラ設定に失敗: {e}")
+
     def _initSdk2(self) -> None:
         """SDK2を初期化"""
         try:
@@ -198,14 +429,23 @@ class Go2BridgeServer:
         """
         clientAddr = websocket.remote_address
         print(f"[Bridge] クライアント接続: {clientAddr}")
-        self.clients.add(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_BATCH_FRAMES)
+        self.clients[websocket] = queue
+        self._clientList = tuple(self.clients.items())
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
+        self._clientsPresent.set()
+        self._markDirty()
+        
+        # 送信バッファ上限/受信サイズ上限はserve()の引数で設定済み
+        self._tuneSocket(websocket)
         
         try:
             # 接続確認メッセージ送信
-            await websocket.send(json.dumps({
+            await websocket.send(_jsonDumps({
                 "type": "connected",
                 "simulationMode": self.simulationMode,
-                "version": "1.0.0"
+                "version": "1.0.0",
+                "formats": ["json", "msgpack"] if MSGPACK_AVAILABLE else ["json"]
             }))
             
             # メッセージ受信ループ
@@ -217,9 +457,28 @@ class Go2BridgeServer:
         except Exception as e:
             print(f"[Bridge] エラー: {e}")
         finally:
-            self.clients.discard(websocket)
+            self._removeClient(websocket)
 
-    async def _handleMessage(self, websocket, message: str) -> None:
+    @staticmethod
+    def _tuneSocket(websocket) -> None:
+        """
+        低遅延向けにソケットオプションを設定
+        
+        小さな状態/コマンドフレームがNagle + 遅延ACKで待たされないようにする
+        
+        Args:
+            websocket: WebSocket接続
+        """
+        sock = websocket.transport.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 256 * 1024)
+        except OSError as e:
+            print(f"[Bridge] ソケット設定エラー: {e}")
+
+    async def _handleMessage(self, websocket, message: Union[str, bytes]) -> None:
         """
         メッセージを処理
         
@@ -228,52 +487,44 @@ class Go2BridgeServer:
             message: 受信メッセージ
         """
         try:
-            data = json.loads(message)
+            data = _jsonLoads(message)
             msgType = data.get("type", "")
             
-            if msgType == "move":
-                # 移動コマンド
-                vx = data.get("vx", 0.0)
-                vy = data.get("vy", 0.0)
-                vyaw = data.get("vyaw", 0.0)
-                self._move(vx, vy, vyaw)
-                
-            elif msgType == "standUp":
-                self._standUp()
-                
-            elif msgType == "standDown":
-                self._standDown()
-                
-            elif msgType == "balanceStand":
-                self._balanceStand()
-                
-            elif msgType == "recoveryStand":
-                self._recoveryStand()
-                
-            elif msgType == "stopMove":
-                self._stopMove()
-                
-            elif msgType == "damp":
-                self._damp()
-                
-            elif msgType == "emergencyStop":
-                self._emergencyStop()
-                
-            elif msgType == "getState":
-                # 状態を返す
-                await websocket.send(json.dumps({
-                    "type": "state",
-                    "data": self.state.toDict()
-                }))
-                
-            elif msgType == "ping":
-                await websocket.send(json.dumps({"type": "pong"}))
+            # 引数なしのコマンド
+            command = self._commands.get(msgType)
+            if command:
+                command()
+                return
+            
+            # 引数/応答を伴うリクエスト
+            handler = self._requestHandlers.get(msgType)
+            if handler:
+                await handler(websocket, data)
                 
         except json.JSONDecodeError:
             print(f"[Bridge] 無効なJSON: {message}")
         except Exception as e:
             print(f"[Bridge] メッセージ処理エラー: {e}")
 
+    async def _onMove(self, websocket, data: dict) -> None:
+        """移動コマンドを処理"""
+        self._move(data.get("vx", 0.0), data.get("vy", 0.0), data.get("vyaw", 0.0))
+
+    async def _replyState(self, websocket, data: dict) -> None:
+        """現在の状態を返す"""
+        await websocket.send(self._stateFrame(websocket in self._binaryClients))
+
+    async def _onSetFormat(self, websocket, data: dict) -> None:
+        """状態配信フォーマットの切り替え（ハンドシェイク）"""
+        if data.get("format") == "msgpack" and MSGPACK_AVAILABLE:
+            self._binaryClients.add(websocket)
+        else:
+            self._binaryClients.discard(websocket)
+
+    async def _replyPong(self, websocket, data: dict) -> None:
+        """Pingに応答"""
+        await websocket.send(PONG_MESSAGE)
+
     def _move(self, vx: float, vy: float, vyaw: float) -> None:
         """移動コマンド"""
         if self.sportClient and not self.simulationMode:
@@ -286,6 +537,7 @@ class Go2BridgeServer:
         self.state.velocityX = vx
         self.state.velocityY = vy
         self.state.velocityYaw = vyaw
+        self._markDirty()
 
     def _standUp(self) -> None:
         """立ち上がり"""
@@ -296,6 +548,7 @@ class Go2BridgeServer:
             except Exception as e:
                 print(f"[Bridge] StandUpエラー: {e}")
         self.state.mode = "STAND"
+        self._markDirty()
 
     def _standDown(self) -> None:
         """伏せる"""
@@ -306,6 +559,7 @@ class Go2BridgeServer:
             except Exception as e:
                 print(f"[Bridge] StandDownエラー: {e}")
         self.state.mode = "DOWN"
+        self._markDirty()
 
     def _balanceStand(self) -> None:
         """バランススタンド"""
@@ -336,6 +590,7 @@ class Go2BridgeServer:
         self.state.velocityX = 0
         self.state.velocityY = 0
         self.state.velocityYaw = 0
+        self._markDirty()
 
     def _damp(self) -> None:
         """ダンプモード"""
@@ -346,6 +601,7 @@ class Go2BridgeServer:
             except Exception as e:
                 print(f"[Bridge] Dampエラー: {e}")
         self.state.mode = "IDLE"
+        self._markDirty()
 
     def _emergencyStop(self) -> None:
         """緊急停止"""
@@ -353,12 +609,19 @@ class Go2BridgeServer:
         self._stopMove()
         self._damp()
 
-    def _stateLoop(self) -> None:
-        """状態更新ループ"""
-        import math
+    async def _stateLoop(self) -> None:
+        """
+        状態更新ループ（20Hz）
         
+        シミュレーションモードでは、クライアントが接続するまで何も計算せずに待機する
+        （SDK2モードでは状態取得は続け、配信だけを省略する）
+        """
         while self.running:
             try:
+                if self.simulationMode and not self._clientsPresent.is_set():
+                    await self._clientsPresent.wait()
+                    continue
+                
                 t = time.time()
                 
                 if self.simulationMode:
@@ -366,66 +629,151 @@ class Go2BridgeServer:
                     self.state.timestamp = t
                     self.state.connected = True
                     self.state.batteryLevel = max(20, 100 - int((t % 1000) / 10))
-                    self.state.batteryVoltage = 25.0 + math.sin(t * 0.1) * 0.5
-                    self.state.batteryCurrent = 2.0 + math.sin(t * 0.5) * 1.0
-                    self.state.imuRoll = math.degrees(math.sin(t * 2) * 0.05)
-                    self.state.imuPitch = math.degrees(math.sin(t * 1.5) * 0.03)
-                    self.state.imuYaw = math.degrees(math.sin(t * 0.3) * 0.1)
-                    self.state.imuGyro = [
-                        math.cos(t * 2) * 0.1,
-                        math.cos(t * 1.5) * 0.06,
-                        math.cos(t * 0.3) * 0.2
-                    ]
-                    self.state.imuAccel = [
-                        math.sin(t) * 0.5,
-                        math.cos(t) * 0.3,
-                        9.81 + math.sin(t * 3) * 0.1
-                    ]
-                    self.state.footContacts = [
-                        (int(t * 2) + i) % 2 == 0 for i in range(4)
-                    ]
-                    self.state.footForces = [
-                        50 + math.sin(t * 3 + i) * 20 if self.state.footContacts[i] else 0
-                        for i in range(4)
-                    ]
+                    
+                    # 全波形を1回のベクトル演算で評価
+                    vals = (
+                        np.sin(self._simOmegas * t + self._simPhases) * self._simAmps
+                        + self._simOffsets
+                    ).tolist()
+                    (
+                        self.state.batteryVoltage,
+                        self.state.batteryCurrent,
+                        self.state.imuRoll,
+                        self.state.imuPitch,
+                        self.state.imuYaw,
+                    ) = vals[0:5]
+                    
+                    # 配列はインプレース更新（毎ティックのリスト生成を避ける）
+                    self.state.imuGyro[:] = vals[5:8]
+                    self.state.imuAccel[:] = vals[8:11]
+                    contacts = self.state.footContacts
+                    forces = self.state.footForces
+                    for i in range(4):
+                        contacts[i] = (int(t * 2) + i) % 2 == 0
+                        forces[i] = vals[11 + i] if contacts[i] else 0
+                    self._markDirty()
                 else:
-                    # 実際のSDK2から状態取得
-                    self._updateRealState()
+                    # 実際のSDK2から状態取得（ブロックし得るのでスレッドで実行）
+                    await asyncio.to_thread(self._updateRealState)
                 
                 # 接続中のクライアントに状態を配信
-                asyncio.run(self._broadcastState())
+                await self._broadcastState()
                 
-                time.sleep(0.05)  # 20Hz
+                await asyncio.sleep(0.05)  # 20Hz
                 
             except Exception as e:
                 print(f"[Bridge] 状態更新エラー: {e}")
-                time.sleep(0.1)
+                await asyncio.sleep(0.1)
 
     def _updateRealState(self) -> None:
-        """実際のSDK2から状態を取得"""
+        """実際のSDK2から状態を取得（変化があれば_markDirty()を呼ぶ）"""
         # TODO: SDK2からの状態取得を実装
         pass
 
     async def _broadcastState(self) -> None:
-        """全クライアントに状態を配信"""
-        if not self.clients:
+        """全クライアントに状態を配信（変化があった場合のみ）"""
+        if not self._clientList or not self._dirty:
             return
+        self._dirty = False
         
-        message = json.dumps({
-            "type": "state",
-            "data": self.state.toDict()
-        })
+        # 各クライアントの送信キューへ投入（フォーマットごとに1回だけエンコード）
+        # 配信側はI/Oを待たない。キューが満杯なら最も古いフレームを破棄する
+        for ws, queue in self._clientList:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(self._stateFrame(ws in self._binaryClients))
+
+    def _markDirty(self) -> None:
+        """状態の変化を記録し、エンコード済みキャッシュを破棄"""
+        self._dirty = True
+        self._frameCache.clear()
+
+    def _stateFrame(self, binary: bool) -> Union[bytes, str]:
+        """
+        状態メッセージを取得（変化がなければキャッシュを再利用）
         
-        # 全クライアントに送信
-        websockets_to_remove = set()
-        for ws in self.clients:
-            try:
-                await ws.send(message)
-            except:
-                websockets_to_remove.add(ws)
+        Args:
+            binary: Trueならmsgpackのバイナリフレーム、FalseならJSON
+            
+        Returns:
+            送信用のフレーム（msgpackはbytes、JSONはstr）
+        """
+        frame = self._frameCache.get(binary)
+        if frame is None:
+            payload = {"type": "state", "data": self.state.toDict()}
+            if binary:
+                frame = msgpack.packb(payload)
+            else:
+                frame = _jsonDumps(payload)
+            self._frameCache[binary] = frame
+        return frame
+
+    async def _writer(self, ws, queue: asyncio.Queue) -> None:
+        """
+        1クライアントへの送信タスク
+        
+        キューに溜まったスナップショットをまとめて取り出し、msgpackクライアントには
+        1メッセージに結合して、JSONクライアントには最新のものだけを送信する。
+        SEND_TIMEOUT以内に送れないクライアントは、他のクライアントへの配信を
+        遅らせないよう切断する。
+        
+        Args:
+            ws: WebSocket接続
+            queue: このクライアントの送信キュー
+        """
+        try:
+            while True:
+                frames = [await queue.get()]
+                while not queue.empty():
+                    frames.append(queue.get_nowait())
+                
+                if len(frames) > 1 and ws in self._binaryClients:
+                    message = self._packBatch(frames)
+                else:
+                    message = frames[-1]
+                await asyncio.wait_for(ws.send(message), timeout=SEND_TIMEOUT)
+        except asyncio.TimeoutError:
+            # 送信途中で打ち切ったためフレームが壊れている → 接続ごと破棄
+            print(f"[Bridge] 送信タイムアウトのため切断: {ws.remote_address}")
+            self._removeClient(ws)
+            ws.transport.abort()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # 切断されたクライアントを削除
+            self._removeClient(ws)
+
+    def _removeClient(self, ws) -> None:
+        """
+        クライアントを登録解除し、送信タスクを停止
+        
+        Args:
+            ws: WebSocket接続
+        """
+        if self.clients.pop(ws, None) is not None:
+            self._clientList = tuple(self.clients.items())
+            if not self.clients:
+                self._clientsPresent.clear()
+        self._binaryClients.discard(ws)
+        writer = self._writers.pop(ws, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+
+    @staticmethod
+    def _packBatch(frames: List[bytes]) -> bytes:
+        """
+        複数のmsgpackフレームを1つのバイナリメッセージに結合
+        
+        各フレームの前に4バイトのビッグエンディアン長を付ける。
+        単体のmsgpackフレーム（先頭はmap型 0x8X）とは先頭バイト0x00で区別できる。
         
-        # 切断されたクライアントを削除
-        self.clients -= websockets_to_remove
+        Args:
+            frames: msgpackエンコード済みの状態フレーム
+            
+        Returns:
+            バッチメッセージ
+        """
+        return b"".join(struct.pack(">I", len(frame)) + frame for frame in frames)
 
 
 # ============================================================================
@@ -438,6 +786,10 @@ def main():
         print("websocketsをインストールしてください: pip install websockets")
         return
     
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+        print("[Bridge] uvloopを使用します")
+    
     server = Go2BridgeServer()
     
     try:
@@ -14,17 +14,74 @@ Unitree Go2 Controller の統合アプリケーション
 
 import sys
 import math
-from typing import Optional
+import time
+from typing import Any, Callable, Optional
 
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtCore import QObject, Signal, Slot, QTimer
 
 from .robot import Go2Client, WebSocketClient, WebRTCClient, ConnectionMode, RobotState
-from .controller import GamepadController, GamepadState, XboxButton
+from .controller import GamepadController, GamepadState, XboxButton, buttonName
 from .ui import MainWindow
 from .utils import setup_logger, get_logger
 
 
+class StateBatcher(QObject):
+    """
+    状態通知のバッチャー
+
+    任意のスレッドから届く状態を最新の1件だけ保持し、
+    GUIスレッドのタイマーで画面更新周期ごとにまとめて通知する。
+    1周期内に届いた古い状態は破棄される（遅れて配送されることはない）
+
+    Attributes:
+        interval: 通知間隔（ミリ秒）
+    """
+
+    def __init__(self, callback: Callable[[Any], None], interval: int = 16, parent: Optional[QObject] = None):
+        """
+        バッチャーの初期化
+
+        Args:
+            callback: GUIスレッドで呼び出す通知先
+            interval: 通知間隔（ミリ秒、デフォルト約60Hz）
+            parent: 親オブジェクト
+        """
+        super().__init__(parent)
+        self.interval = interval
+        self._callback = callback
+        self._latest: Any = None
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._flush)
+
+    def start(self) -> None:
+        """通知タイマーを開始"""
+        self._timer.start(self.interval)
+
+    def stop(self) -> None:
+        """通知タイマーを停止し、未通知の状態を破棄"""
+        self._timer.stop()
+        self._latest = None
+
+    def push(self, state: Any) -> None:
+        """
+        状態を登録（任意のスレッドから呼び出し可）
+
+        Args:
+            state: 最新の状態
+        """
+        self._latest = state
+
+    def _flush(self) -> None:
+        """保持している最新状態を通知"""
+        state = self._latest
+        if state is None:
+            return
+        self._latest = None
+        self._callback(state)
+
+
 class Go2ControllerApp(QObject):
     """
     Go2コントローラーアプリケーション
@@ -53,6 +110,10 @@ class Go2ControllerApp(QObject):
     BASE_SPEED_VYAW = 0.8    # 基本旋回速度 (rad/s)
     BOOST_MULTIPLIER = 1.5   # ブースト時の速度倍率
 
+    # 移動コマンドの間引き
+    MOVE_DEADBAND = 1e-3     # この差未満の速度変化は送信しない
+    MOVE_HEARTBEAT = 0.25    # 変化がなくてもこの間隔(秒)で再送（コントローラー喪失検出用）
+
     # Jetson WebSocketポート
     JETSON_WS_PORT = 8765
 
@@ -76,11 +137,29 @@ class Go2ControllerApp(QObject):
         self._connected = False
         self._speedMultiplier = 1.0
         self._lastRobotState: Optional[RobotState] = None
+        self._lastMove = (0.0, 0.0, 0.0)  # 最後に送信した (vx, vy, vyaw)
+        self._lastMoveTime = 0.0          # 最後に送信した時刻 (monotonic)
 
         # タイマー
-        self._gamepadTimer: Optional[QTimer] = None
         self._controlTimer: Optional[QTimer] = None
 
+        # 状態通知のバッチャー（GUI作成後に生成）
+        self._robotStateBatcher: Optional[StateBatcher] = None
+        self._gamepadStateBatcher: Optional[StateBatcher] = None
+        self._videoFrameBatcher: Optional[StateBatcher] = None
+
+        # ゲームパッドボタン → 処理（XboxButtonはintなのでボタン番号でも引ける）
+        self._buttonHandlers = {
+            XboxButton.A: self._onStandUp,
+            XboxButton.B: self._onStandDown,
+            XboxButton.X: self._onBalanceStand,
+            XboxButton.Y: self._onDamp,
+            XboxButton.BACK: self._onEmergencyStop,
+            XboxButton.START: self._onRecovery,
+            XboxButton.LB: self._onSpeedDown,
+            XboxButton.RB: self._onSpeedUp,
+        }
+
     def initialize(self) -> bool:
         """
         アプリケーションの初期化
@@ -99,16 +178,25 @@ class Go2ControllerApp(QObject):
             self.gamepad.initialize()
             self.gamepad.start()
 
+            # 状態通知は画面更新周期にまとめてGUIスレッドで反映
+            self._robotStateBatcher = StateBatcher(self._onRobotState, parent=self)
+            self._gamepadStateBatcher = StateBatcher(self._onGamepadState, parent=self)
+            # 映像はカメラの実フレームレート程度（約30Hz）で十分
+            self._videoFrameBatcher = StateBatcher(self._onVideoFrame, interval=33, parent=self)
+            self._robotStateBatcher.start()
+            self._gamepadStateBatcher.start()
+            self._videoFrameBatcher.start()
+
             # コールバック設定
-            self.gamepad.setStateCallback(self._onGamepadState)
+            self.gamepad.setStateCallback(self._gamepadStateBatcher.push)
             self.gamepad.setButtonCallback(self._onGamepadButton)
 
-            # ゲームパッドポーリングタイマー（メインスレッドで実行必須）
-            self._gamepadTimer = QTimer()
-            self._gamepadTimer.timeout.connect(self._pollGamepad)
-            self._gamepadTimer.start(16)  # ~60Hz
+            # ゲームパッドポーリング
+            # 可能なら専用スレッドで実行し、GUI負荷による入力遅延を避ける
+            # （macOSではpygameのイベント処理がメインスレッド必須のため制御ループ内で実行）
+            self.gamepad.startPollThread()
 
-            # 制御ループタイマー
+            # 制御ループタイマー（ゲームパッドのポーリングも兼ねる）
             self._controlTimer = QTimer()
             self._controlTimer.timeout.connect(self._controlLoop)
             self._controlTimer.start(20)  # 50Hz
@@ -137,14 +225,6 @@ class Go2ControllerApp(QObject):
         self.window.actionsWidget.actionTriggered.connect(self._onSpecialAction)
         self.window.actionsWidget.obstacleAvoidChanged.connect(self._onObstacleAvoidChanged)
 
-    def _pollGamepad(self) -> None:
-        """
-        ゲームパッドをポーリング（メインスレッドで実行）
-        
-        macOSではpygameのイベント処理はメインスレッドでのみ可能
-        """
-        self.gamepad.poll()
-
     @Slot(str)
     def _onConnect(self, ip: str) -> None:
         """
@@ -178,8 +258,8 @@ class Go2ControllerApp(QObject):
                         robotIp=ip, 
                         connectionMode=ConnectionMode.LOCAL_STA
                     )
-                self.robotClient.setStateCallback(self._onRobotState)
-                self.robotClient.setVideoCallback(self._onVideoFrame)
+                self.robotClient.setStateCallback(self._robotStateBatcher.push)
+                self.robotClient.setVideoCallback(self._videoFrameBatcher.push)
                 
                 if self.robotClient.connect():
                     self._connected = True
@@ -191,7 +271,7 @@ class Go2ControllerApp(QObject):
             elif self._connectionMode == "websocket":
                 # WebSocket経由でJetsonに接続
                 self.robotClient = WebSocketClient(jetsonIp=ip, port=self.JETSON_WS_PORT)
-                self.robotClient.setStateCallback(self._onRobotState)
+                self.robotClient.setStateCallback(self._robotStateBatcher.push)
                 
                 if self.robotClient.connect():
                     self._connected = True
@@ -203,8 +283,8 @@ class Go2ControllerApp(QObject):
                 # 従来のSDK2直接接続（シミュレーション）
                 self.robotClient = Go2Client()
                 self.robotClient.robotIp = ip
-                self.robotClient.setStateCallback(self._onRobotState)
-                self.robotClient.setVideoCallback(self._onVideoFrame)
+                self.robotClient.setStateCallback(self._robotStateBatcher.push)
+                self.robotClient.setVideoCallback(self._videoFrameBatcher.push)
                 
                 if self.robotClient.connect():
                     self._connected = True
@@ -357,8 +437,8 @@ class Go2ControllerApp(QObject):
             )
 
             # 足状態更新
-            contacts = [foot.contact for foot in state.feet]
-            forces = [foot.force for foot in state.feet]
+            contacts = state.feet.contact.tolist()
+            forces = state.feet.force.tolist()
             self.window.updateFootStates(contacts, forces)
 
     def _onVideoFrame(self, frame) -> None:
@@ -388,55 +468,63 @@ class Go2ControllerApp(QObject):
                 state.rightStickY,
                 state.leftTrigger,
                 state.rightTrigger,
-                state.buttons,
+                state.buttonsMask,
                 state.isButtonPressed(XboxButton.L_STICK),
                 state.isButtonPressed(XboxButton.R_STICK)
             )
 
-    def _onGamepadButton(self, button: XboxButton, pressed: bool) -> None:
+    def _onGamepadButton(self, button: int, pressed: bool) -> None:
         """
         ゲームパッドボタンイベントコールバック
 
         Args:
-            button: 押されたボタン
+            button: 押されたボタン番号（XboxButtonの値）
             pressed: 押下状態
         """
         if not pressed:  # ボタンリリース時は無視
             return
 
-        self.logger.debug(f"ボタン: {button.name}")
-
-        if button == XboxButton.A:
-            self._onStandUp()
-        elif button == XboxButton.B:
-            self._onStandDown()
-        elif button == XboxButton.X:
-            if self._connected and self.robotClient:
-                self.robotClient.balanceStand()
-        elif button == XboxButton.Y:
-            if self._connected and self.robotClient:
-                self.robotClient.damp()
-        elif button == XboxButton.BACK:
-            self._onEmergencyStop()
-        elif button == XboxButton.START:
-            self._onRecovery()
-        elif button == XboxButton.LB:
-            self._speedMultiplier = max(0.3, self._speedMultiplier - 0.1)
-            self.logger.info(f"速度倍率: {self._speedMultiplier:.1f}")
-        elif button == XboxButton.RB:
-            self._speedMultiplier = min(1.5, self._speedMultiplier + 0.1)
-            self.logger.info(f"速度倍率: {self._speedMultiplier:.1f}")
+        self.logger.debug(f"ボタン: {buttonName(button)}")
+
+        handler = self._buttonHandlers.get(button)
+        if handler:
+            handler()
+
+    def _onBalanceStand(self) -> None:
+        """バランススタンドコマンド"""
+        if self._connected and self.robotClient:
+            self.robotClient.balanceStand()
+
+    def _onDamp(self) -> None:
+        """脱力コマンド"""
+        if self._connected and self.robotClient:
+            self.robotClient.damp()
+
+    def _onSpeedDown(self) -> None:
+        """速度倍率を下げる"""
+        self._speedMultiplier = max(0.3, self._speedMultiplier - 0.1)
+        self.logger.info(f"速度倍率: {self._speedMultiplier:.1f}")
+
+    def _onSpeedUp(self) -> None:
+        """速度倍率を上げる"""
+        self._speedMultiplier = min(1.5, self._speedMultiplier + 0.1)
+        self.logger.info(f"速度倍率: {self._speedMultiplier:.1f}")
 
     def _controlLoop(self) -> None:
         """
         制御ループ（50Hz）
 
-        コントローラー入力を処理して移動コマンドを送信
+        ゲームパッドをポーリングし、コントローラー入力を処理して移動コマンドを送信
         """
+        # ポーリングスレッドがない場合（macOS）はここ（メインスレッド）でポーリング
+        if not self.gamepad.isPollThreadRunning:
+            self.gamepad.poll()
+        self.gamepad.dispatch()
+
         if not self._connected or not self.robotClient:
             return
 
-        state = self.gamepad.state
+        state = self.gamepad.latest
         if not state.connected:
             return
 
@@ -453,8 +541,19 @@ class Go2ControllerApp(QObject):
         if state.leftTrigger > 0.1:
             vx *= -(1.0 + state.leftTrigger * (self.BOOST_MULTIPLIER - 1.0))
 
+        # 前回と同じ速度ならハートビート間隔まで送信を省略
+        now = time.monotonic()
+        lastVx, lastVy, lastVyaw = self._lastMove
+        if (abs(vx - lastVx) < self.MOVE_DEADBAND
+                and abs(vy - lastVy) < self.MOVE_DEADBAND
+                and abs(vyaw - lastVyaw) < self.MOVE_DEADBAND
+                and now - self._lastMoveTime < self.MOVE_HEARTBEAT):
+            return
+
         # 移動コマンド送信
         self.robotClient.move(vx, vy, vyaw)
+        self._lastMove = (vx, vy, vyaw)
+        self._lastMoveTime = now
 
     def run(self) -> int:
         """
@@ -481,11 +580,11 @@ class Go2ControllerApp(QObject):
         self.logger.info("終了処理中...")
 
         # タイマー停止
-        if self._gamepadTimer:
-            self._gamepadTimer.stop()
-        
         if self._controlTimer:
             self._controlTimer.stop()
+        for batcher in (self._robotStateBatcher, self._gamepadStateBatcher, self._videoFrameBatcher):
+            if batcher:
+                batcher.stop()
 
         # ゲームパッド停止
         self.gamepad.stop()
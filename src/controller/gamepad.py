@@ -13,12 +13,25 @@ Xbox互換コントローラーからの入力を処理
 - macOSでのXbox互換コントローラーのみサポート
 - pygameライブラリが必要
 - macOSではメインスレッドでのみイベント処理可能
+  （それ以外のOSでは専用スレッドでのポーリングに対応）
 """
 
-from dataclasses import dataclass, field
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
 from typing import Optional, Callable, Dict, Any
 from enum import IntEnum
 
+import numpy as np
+
+# pygame（未インストールの場合はinitialize()で検出）
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
 
 class XboxButton(IntEnum):
     """
@@ -39,6 +52,10 @@ class XboxButton(IntEnum):
     R_STICK = 10    # 右スティック押し込み
 
 
+# 定義済みのボタン数（XboxButtonの値は0から連番）
+_NUM_XBOX_BUTTONS = len(XboxButton)
+
+
 class XboxAxis(IntEnum):
     """
     Xboxコントローラーの軸マッピング
@@ -51,7 +68,7 @@ class XboxAxis(IntEnum):
     RT = 5          # 右トリガー（または5）
 
 
-@dataclass
+@dataclass(slots=True)
 class GamepadState:
     """
     ゲームパッドの現在状態
@@ -64,7 +81,7 @@ class GamepadState:
         rightStickY: 右スティックY軸 (-1.0 ~ 1.0)
         leftTrigger: 左トリガー (0.0 ~ 1.0)
         rightTrigger: 右トリガー (0.0 ~ 1.0)
-        buttons: 各ボタンの押下状態
+        buttonsMask: 各ボタンの押下状態（ビットiがボタン番号iに対応）
         dpadX: D-Pad X軸 (-1, 0, 1)
         dpadY: D-Pad Y軸 (-1, 0, 1)
     """
@@ -81,8 +98,8 @@ class GamepadState:
     leftTrigger: float = 0.0
     rightTrigger: float = 0.0
     
-    # ボタン状態（キー: ボタン番号, 値: 押下状態）
-    buttons: Dict[int, bool] = field(default_factory=dict)
+    # ボタン状態（ビットマスク、押下中のボタン番号のビットが1）
+    buttonsMask: int = 0
     
     # D-Pad
     dpadX: int = 0
@@ -98,12 +115,27 @@ class GamepadState:
         Returns:
             bool: 押されている場合True
         """
-        return self.buttons.get(button, False)
+        return bool(self.buttonsMask & (1 << button))
 
     def copy(self) -> "GamepadState":
-        """状態のコピーを作成"""
-        import copy
-        return copy.deepcopy(self)
+        """
+        状態のコピーを作成
+
+        全フィールドが不変値なので浅いコピーで十分
+        """
+        return GamepadState(
+            connected=self.connected,
+            controllerName=self.controllerName,
+            leftStickX=self.leftStickX,
+            leftStickY=self.leftStickY,
+            rightStickX=self.rightStickX,
+            rightStickY=self.rightStickY,
+            leftTrigger=self.leftTrigger,
+            rightTrigger=self.rightTrigger,
+            buttonsMask=self.buttonsMask,
+            dpadX=self.dpadX,
+            dpadY=self.dpadY,
+        )
 
 
 class GamepadController:
@@ -115,13 +147,22 @@ class GamepadController:
 
     Note:
         macOSではpygameのイベント処理はメインスレッドでのみ実行可能。
-        poll()メソッドをQTimerなどでメインスレッドから呼び出すこと。
+        poll()とdispatch()をQTimerなどでメインスレッドから呼び出すこと。
+        それ以外のOSではstartPollThread()で専用スレッドからポーリングし、
+        メインスレッドからはdispatch()だけを呼び出せばよい。
 
     Attributes:
-        state: 現在のゲームパッド状態
+        state: 現在のゲームパッド状態（ポーリング側が書き換える）
+        latest: 最新の状態スナップショット（読み取り専用として扱う）
         deadzone: スティックのデッドゾーン閾値
     """
 
+    # 専用スレッドでのポーリングが可能か（macOSはメインスレッド必須）
+    THREADED_POLLING_SUPPORTED = sys.platform != "darwin"
+
+    # この値以下の軸の変化は無視（デッドゾーン外のアナログノイズ対策）
+    AXIS_EPSILON = 1e-4
+
     def __init__(self, deadzone: float = 0.15):
         """
         ゲームパッドコントローラーの初期化
@@ -130,18 +171,44 @@ class GamepadController:
             deadzone: スティックのデッドゾーン閾値 (0.0 ~ 1.0)
         """
         self.state = GamepadState()
+        self.latest = GamepadState()
         self.deadzone = deadzone
         
+        # スティック4軸（LX, LY, RX, RY）の作業バッファ
+        self._stickBuf = np.zeros(4, dtype=np.float32)
+        
         # pygame関連
         self._joystick = None
         self._pygameInitialized = False
+        self._instanceId: Optional[int] = None
+        self._numAxes = 0
+        self._numSticks = 0
+        
+        # イベント種別 → 処理（pygame初期化時に構築）
+        self._eventHandlers: Dict[int, Callable[[Any], None]] = {}
+        
+        # 全入力の読み直しが必要か（接続直後など）
+        self._needsSync = False
+        # スティック軸のイベントを受信したか（デッドゾーン再計算が必要）
+        self._sticksChanged = False
         
         # コールバック
         self._stateCallback: Optional[Callable[[GamepadState], None]] = None
-        self._buttonCallback: Optional[Callable[[XboxButton, bool], None]] = None
+        self._buttonCallback: Optional[Callable[[int, bool], None]] = None
         
-        # 前回のボタン状態（変化検出用）
-        self._prevButtons: Dict[int, bool] = {}
+        # 状態変化の追跡
+        # _dirty: 前回のスナップショット以降にstateが変化した（ポーリング側のみ使用）
+        # _statePending: 未通知のスナップショットがある（dispatch()がクリア）
+        self._dirty = True
+        self._statePending = False
+        
+        # ボタンイベント（ポーリング側が追加し、dispatch()が取り出す）
+        # deque.append/popleftはスレッドセーフなのでロック不要
+        self._buttonEvents: deque = deque(maxlen=64)
+        
+        # ポーリングスレッド
+        self._pollThread: Optional[threading.Thread] = None
+        self._polling = False
 
     def initialize(self) -> bool:
         """
@@ -150,25 +217,31 @@ class GamepadController:
         Returns:
             bool: 初期化成功時True
         """
+        if pygame is None:
+            print("[GamepadController] pygameがインストールされていません")
+            return False
+        
         try:
-            import pygame
-            
             # pygame初期化（ジョイスティックのみ）
             pygame.init()
             pygame.joystick.init()
             
             self._pygameInitialized = True
+            self._eventHandlers = {
+                pygame.JOYAXISMOTION: self._onAxisMotion,
+                pygame.JOYBUTTONDOWN: self._onButtonEvent,
+                pygame.JOYBUTTONUP: self._onButtonEvent,
+                pygame.JOYHATMOTION: self._onHatMotion,
+                pygame.JOYDEVICEADDED: self._onDeviceAdded,
+                pygame.JOYDEVICEREMOVED: self._onDeviceRemoved,
+            }
             
             # コントローラーの検出
             numJoysticks = pygame.joystick.get_count()
             print(f"[GamepadController] 検出されたコントローラー数: {numJoysticks}")
             
             if numJoysticks > 0:
-                self._joystick = pygame.joystick.Joystick(0)
-                self._joystick.init()
-                
-                self.state.connected = True
-                self.state.controllerName = self._joystick.get_name()
+                self._attachJoystick(0)
                 print(f"[GamepadController] 接続: {self.state.controllerName}")
                 print(f"  - ボタン数: {self._joystick.get_numbuttons()}")
                 print(f"  - 軸数: {self._joystick.get_numaxes()}")
@@ -179,9 +252,6 @@ class GamepadController:
             
             return True
             
-        except ImportError:
-            print("[GamepadController] pygameがインストールされていません")
-            return False
         except Exception as e:
             print(f"[GamepadController] 初期化エラー: {e}")
             return False
@@ -199,12 +269,63 @@ class GamepadController:
         
         print("[GamepadController] 初期化完了（poll()をメインスレッドから呼び出してください）")
 
+    def startPollThread(self, interval: float = 1 / 60) -> bool:
+        """
+        専用スレッドでポーリングを開始
+
+        GUIスレッドの負荷に関係なく一定周期で入力を読み取る。
+        コールバックはスレッドからは呼ばれず、dispatch()の呼び出し元スレッドで実行される。
+
+        Args:
+            interval: ポーリング周期（秒）
+
+        Returns:
+            bool: スレッドを開始した場合True（macOSなど非対応の場合False）
+        """
+        if not self.THREADED_POLLING_SUPPORTED or not self._pygameInitialized:
+            return False
+        if self._pollThread and self._pollThread.is_alive():
+            return True
+        
+        self._polling = True
+        self._pollThread = threading.Thread(
+            target=self._pollLoop, args=(interval,), daemon=True
+        )
+        self._pollThread.start()
+        return True
+
+    @property
+    def isPollThreadRunning(self) -> bool:
+        """ポーリングスレッドが動作中か"""
+        return self._pollThread is not None and self._pollThread.is_alive()
+
+    def _pollLoop(self, interval: float) -> None:
+        """
+        ポーリングスレッドのループ
+
+        Args:
+            interval: ポーリング周期（秒）
+        """
+        nextTick = time.monotonic()
+        while self._polling:
+            self.poll()
+            nextTick += interval
+            delay = nextTick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                nextTick = time.monotonic()
+
     def stop(self) -> None:
         """
         ゲームパッドの使用を停止
         """
+        self._polling = False
+        if self._pollThread and self._pollThread.is_alive():
+            self._pollThread.join(timeout=1.0)
+        self._pollThread = None
+        
         if self._pygameInitialized:
-            import pygame
             pygame.joystick.quit()
             pygame.quit()
             self._pygameInitialized = False
@@ -213,46 +334,60 @@ class GamepadController:
 
     def poll(self) -> None:
         """
-        入力をポーリング（メインスレッドから呼び出すこと）
+        入力をポーリング
         
-        この関数をQTimerなどでメインスレッドから定期的に呼び出す
+        macOSではQTimerなどでメインスレッドから定期的に呼び出す。
+        SDLのイベントキューに届いた入力だけを反映するため、無操作時はほぼ処理がない。
+        読み取った状態はlatestに公開され、ボタンイベントはキューに積まれる
+        （コールバックの呼び出しはdispatch()で行う）。
         """
         if not self._pygameInitialized:
             return
         
         try:
-            import pygame
-            
-            # pygameイベント処理（メインスレッドで実行必須）
-            pygame.event.pump()
-            
-            # コントローラー接続チェック
-            numJoysticks = pygame.joystick.get_count()
-            
-            if numJoysticks == 0 and self.state.connected:
-                # 切断検出
-                self.state.connected = False
-                self._joystick = None
-                print("[GamepadController] コントローラーが切断されました")
-                
-            elif numJoysticks > 0 and not self.state.connected:
-                # 再接続検出
-                self._joystick = pygame.joystick.Joystick(0)
-                self._joystick.init()
-                self.state.connected = True
-                self.state.controllerName = self._joystick.get_name()
-                print(f"[GamepadController] コントローラーが再接続されました: {self.state.controllerName}")
+            # pygameイベント処理（macOSではメインスレッドで実行必須）
+            handlers = self._eventHandlers
+            for event in pygame.event.get():
+                handler = handlers.get(event.type)
+                if handler:
+                    handler(event)
             
-            if self._joystick and self.state.connected:
+            # 接続直後は現在値をまとめて読み直す（イベントが来ない入力の初期値）
+            if self._needsSync and self._joystick and self.state.connected:
+                self._needsSync = False
                 self._updateState()
             
-            # コールバック呼び出し
-            if self._stateCallback:
-                self._stateCallback(self.state.copy())
+            if self._sticksChanged:
+                self._sticksChanged = False
+                self._refreshSticks()
+            
+            # 変化があった時だけスナップショットを公開（参照の代入はGILの下でアトミック）
+            if self._dirty:
+                self._dirty = False
+                self.latest = self.state.copy()
+                self._statePending = True
                 
         except Exception as e:
             print(f"[GamepadController] ポーリングエラー: {e}")
 
+    def dispatch(self) -> None:
+        """
+        溜まったボタンイベントと最新状態をコールバックへ通知
+
+        コールバックを実行したいスレッド（通常はメインスレッド）から呼び出す。
+        """
+        events = self._buttonEvents
+        while events:
+            button, pressed = events.popleft()
+            if self._buttonCallback:
+                self._buttonCallback(button, pressed)
+        
+        # 新しいスナップショットがある時だけ通知
+        # （先にフラグを下ろすので、競合しても取りこぼしはなく重複通知になるだけ）
+        if self._stateCallback and self._statePending:
+            self._statePending = False
+            self._stateCallback(self.latest)
+
     def setStateCallback(self, callback: Callable[[GamepadState], None]) -> None:
         """
         状態更新コールバックを設定
@@ -262,109 +397,231 @@ class GamepadController:
         """
         self._stateCallback = callback
 
-    def setButtonCallback(self, callback: Callable[[XboxButton, bool], None]) -> None:
+    def setButtonCallback(self, callback: Callable[[int, bool], None]) -> None:
         """
         ボタンイベントコールバックを設定
 
         Args:
-            callback: (ボタン, 押下状態) を受け取るコールバック関数
+            callback: (ボタン番号, 押下状態) を受け取るコールバック関数
+                ボタン番号はXboxButtonの値（必要ならXboxButton(番号)で変換）
         """
         self._buttonCallback = callback
 
+    def _attachJoystick(self, deviceIndex: int) -> None:
+        """
+        ジョイスティックを開いて使用対象にする
+
+        Args:
+            deviceIndex: デバイス番号
+        """
+        self._joystick = pygame.joystick.Joystick(deviceIndex)
+        self._joystick.init()
+        self._instanceId = self._joystick.get_instance_id()
+        self._numAxes = self._joystick.get_numaxes()
+        self._numSticks = 4 if self._numAxes >= 4 else (2 if self._numAxes >= 2 else 0)
+        
+        self.state.connected = True
+        self.state.controllerName = self._joystick.get_name()
+        self._needsSync = True
+        self._dirty = True
+
+    def _onDeviceAdded(self, event: Any) -> None:
+        """コントローラー接続イベント"""
+        if self.state.connected:
+            return
+        self._attachJoystick(event.device_index)
+        print(f"[GamepadController] コントローラーが再接続されました: {self.state.controllerName}")
+
+    def _onDeviceRemoved(self, event: Any) -> None:
+        """コントローラー切断イベント"""
+        if not self.state.connected or event.instance_id != self._instanceId:
+            return
+        self.state.connected = False
+        self._joystick = None
+        self._instanceId = None
+        self._dirty = True
+        print("[GamepadController] コントローラーが切断されました")
+
+    def _onAxisMotion(self, event: Any) -> None:
+        """軸の変化イベント"""
+        if event.instance_id != self._instanceId:
+            return
+        
+        axis = event.axis
+        value = event.value
+        st = self.state
+        
+        if axis < self._numSticks:
+            # スティックはpoll()の最後にまとめてデッドゾーンを適用
+            self._stickBuf[axis] = value
+            self._sticksChanged = True
+            return
+        
+        # トリガー（0~1にマッピング、_updateStateと同じ割り当て）
+        before = (st.leftTrigger, st.rightTrigger)
+        if self._numAxes >= 6:
+            if axis == 4:
+                st.leftTrigger = (value + 1.0) / 2.0
+            elif axis == 5:
+                st.rightTrigger = (value + 1.0) / 2.0
+        elif self._numAxes >= 5 and axis == 4:
+            st.leftTrigger = max(0, value)
+            st.rightTrigger = max(0, value)
+        
+        if (abs(st.leftTrigger - before[0]) > self.AXIS_EPSILON
+                or abs(st.rightTrigger - before[1]) > self.AXIS_EPSILON):
+            self._dirty = True
+
+    def _onButtonEvent(self, event: Any) -> None:
+        """ボタンの押下・解放イベント"""
+        i = event.button
+        if event.instance_id != self._instanceId or i >= 15:
+            return
+        
+        pressed = event.type == pygame.JOYBUTTONDOWN
+        bit = 1 << i
+        mask = self.state.buttonsMask
+        if pressed != bool(mask & bit):
+            self.state.buttonsMask = mask ^ bit
+            self._dirty = True
+            if i < _NUM_XBOX_BUTTONS:
+                self._buttonEvents.append((i, pressed))
+
+    def _onHatMotion(self, event: Any) -> None:
+        """D-Pad（ハット）の変化イベント"""
+        if event.instance_id != self._instanceId or event.hat != 0:
+            return
+        dpadX, dpadY = event.value
+        if (dpadX, dpadY) != (self.state.dpadX, self.state.dpadY):
+            self.state.dpadX = dpadX
+            self.state.dpadY = dpadY
+            self._dirty = True
+
+    def _refreshSticks(self) -> None:
+        """
+        スティック軸の生値バッファからデッドゾーン適用後の値を反映
+        """
+        numSticks = self._numSticks
+        if numSticks == 0:
+            return
+        
+        st = self.state
+        before = (st.leftStickX, st.leftStickY, st.rightStickX, st.rightStickY)
+        sticks = self._applyDeadzoneArray(self._stickBuf[:numSticks]).tolist()
+        st.leftStickX = sticks[XboxAxis.LEFT_X]
+        st.leftStickY = sticks[XboxAxis.LEFT_Y]
+        if numSticks == 4:
+            st.rightStickX = sticks[XboxAxis.RIGHT_X]
+            st.rightStickY = sticks[XboxAxis.RIGHT_Y]
+        
+        after = (st.leftStickX, st.leftStickY, st.rightStickX, st.rightStickY)
+        if any(abs(a - b) > self.AXIS_EPSILON for a, b in zip(before, after)):
+            self._dirty = True
+
     def _updateState(self) -> None:
         """
-        ジョイスティックから現在の状態を読み取り
+        ジョイスティックから現在の状態をすべて読み取り
+
+        接続直後など、イベントだけでは現在値が分からない場合に使用
         """
-        if not self._joystick:
+        js = self._joystick
+        if not js:
             return
         
-        numAxes = self._joystick.get_numaxes()
-        numButtons = self._joystick.get_numbuttons()
-        numHats = self._joystick.get_numhats()
-        
-        # 軸の読み取り
-        if numAxes >= 2:
-            self.state.leftStickX = self._applyDeadzone(
-                self._joystick.get_axis(XboxAxis.LEFT_X)
-            )
-            self.state.leftStickY = self._applyDeadzone(
-                self._joystick.get_axis(XboxAxis.LEFT_Y)
-            )
-        
-        if numAxes >= 4:
-            # macOSでは軸のマッピングが異なる場合がある
-            self.state.rightStickX = self._applyDeadzone(
-                self._joystick.get_axis(2 if numAxes <= 4 else XboxAxis.RIGHT_X)
-            )
-            self.state.rightStickY = self._applyDeadzone(
-                self._joystick.get_axis(3 if numAxes <= 4 else XboxAxis.RIGHT_Y)
-            )
+        # 属性参照をループの外で一度だけ解決
+        getAxis = js.get_axis
+        getButton = js.get_button
+        
+        numAxes = self._numAxes
+        numButtons = js.get_numbuttons()
+        numHats = js.get_numhats()
+        
+        st = self.state
+        axesBefore = (
+            st.leftStickX, st.leftStickY, st.rightStickX, st.rightStickY,
+            st.leftTrigger, st.rightTrigger
+        )
+        hatBefore = (st.dpadX, st.dpadY)
+        
+        # スティック軸の読み取り（デッドゾーンは全軸まとめて適用）
+        buf = self._stickBuf
+        for i in range(self._numSticks):
+            buf[i] = getAxis(i)
+        self._refreshSticks()
         
         # トリガーの読み取り（0~1にマッピング）
         if numAxes >= 6:
             # 軸4,5がトリガーの場合
-            self.state.leftTrigger = (self._joystick.get_axis(4) + 1.0) / 2.0
-            self.state.rightTrigger = (self._joystick.get_axis(5) + 1.0) / 2.0
+            st.leftTrigger = (getAxis(4) + 1.0) / 2.0
+            st.rightTrigger = (getAxis(5) + 1.0) / 2.0
         elif numAxes >= 5:
             # 軸2がLT, 軸5がRTの場合（一部コントローラー）
-            self.state.leftTrigger = max(0, self._joystick.get_axis(4))
-            self.state.rightTrigger = max(0, self._joystick.get_axis(4))
+            st.leftTrigger = max(0, getAxis(4))
+            st.rightTrigger = max(0, getAxis(4))
         
-        # ボタンの読み取り
+        # ボタンの読み取り（ビットマスクに詰める）
+        newMask = 0
         for i in range(min(numButtons, 15)):
-            pressed = self._joystick.get_button(i)
-            prevPressed = self._prevButtons.get(i, False)
-            
-            self.state.buttons[i] = pressed
-            
-            # ボタン状態変化の検出
-            if pressed != prevPressed:
-                self._prevButtons[i] = pressed
-                if self._buttonCallback:
-                    try:
-                        button = XboxButton(i)
-                        self._buttonCallback(button, pressed)
-                    except ValueError:
-                        # 未定義のボタン番号
-                        pass
+            if getButton(i):
+                newMask |= 1 << i
+        
+        # 変化したビットだけを下位から順に通知
+        changed = newMask ^ st.buttonsMask
+        st.buttonsMask = newMask
+        if changed:
+            self._dirty = True
+        while changed:
+            low = changed & -changed
+            changed ^= low
+            button = low.bit_length() - 1
+            if button < _NUM_XBOX_BUTTONS:
+                self._buttonEvents.append((button, bool(newMask & low)))
         
         # D-Pad（ハット）の読み取り
         if numHats > 0:
-            hat = self._joystick.get_hat(0)
-            self.state.dpadX = hat[0]
-            self.state.dpadY = hat[1]
-
-    def _applyDeadzone(self, value: float) -> float:
+            st.dpadX, st.dpadY = js.get_hat(0)
+        
+        # 軸・ハットの変化を検出
+        axesAfter = (
+            st.leftStickX, st.leftStickY, st.rightStickX, st.rightStickY,
+            st.leftTrigger, st.rightTrigger
+        )
+        if (hatBefore != (st.dpadX, st.dpadY)
+                or any(abs(a - b) > self.AXIS_EPSILON for a, b in zip(axesBefore, axesAfter))):
+            self._dirty = True
+
+    def _applyDeadzoneArray(self, values: np.ndarray) -> np.ndarray:
         """
-        デッドゾーンを適用
+        複数軸にまとめてデッドゾーンを適用
 
         Args:
-            value: 入力値 (-1.0 ~ 1.0)
+            values: 入力値の配列 (-1.0 ~ 1.0)
 
         Returns:
-            float: デッドゾーン適用後の値
-        """
-        if abs(value) < self.deadzone:
-            return 0.0
-        
-        # デッドゾーン外の値を0~1に再マッピング
-        sign = 1.0 if value > 0 else -1.0
-        normalizedValue = (abs(value) - self.deadzone) / (1.0 - self.deadzone)
-        return sign * normalizedValue
-
-
-# ボタン名のマッピング（表示用）
-BUTTON_NAMES = {
-    XboxButton.A: "A",
-    XboxButton.B: "B",
-    XboxButton.X: "X",
-    XboxButton.Y: "Y",
-    XboxButton.LB: "LB",
-    XboxButton.RB: "RB",
-    XboxButton.BACK: "BACK",
-    XboxButton.START: "START",
-    XboxButton.GUIDE: "GUIDE",
-    XboxButton.L_STICK: "L3",
-    XboxButton.R_STICK: "R3",
-}
+            np.ndarray: デッドゾーン適用後の値
+        """
+        magnitude = np.abs(values)
+        scaled = np.sign(values) * (magnitude - self.deadzone) / (1.0 - self.deadzone)
+        scaled[magnitude < self.deadzone] = 0.0
+        return scaled
+
+
+# ボタン名（表示用、XboxButtonの値でインデックス）
+BUTTON_NAMES_TBL = ("A", "B", "X", "Y", "LB", "RB", "BACK", "START", "GUIDE", "L3", "R3")
+
+# ボタン名のマッピング（互換用）
+BUTTON_NAMES = dict(zip(XboxButton, BUTTON_NAMES_TBL))
+
+
+def buttonName(button: int) -> str:
+    """
+    ボタンの表示名を取得
+
+    Args:
+        button: ボタン番号（XboxButtonまたはint）
+
+    Returns:
+        str: 表示名
+    """
+    return BUTTON_NAMES_TBL[button]
 
@@ -12,7 +12,7 @@ Unitree Go2との通信を担当するモジュール
 from .go2_client import Go2Client
 from .ws_client import WebSocketClient
 from .webrtc_client import WebRTCClient, ConnectionMode
-from .state import RobotState, MotorState, IMUState
+from .state import RobotState, MotorState, MotorArray, FootArray, IMUState
 from .go2_commands import (
     RtcTopic, SportCmd, ObstacleAvoidCmd, GaitType, SpeedLevel
 )
@@ -24,6 +24,8 @@ __all__ = [
     "ConnectionMode",
     "RobotState",
     "MotorState",
+    "MotorArray",
+    "FootArray",
     "IMUState",
     "RtcTopic",
     "SportCmd",
@@ -15,14 +15,21 @@ SDK2を使用してGo2との通信を管理するクライアントクラス
 - SDK2がインストールされている必要がある
 """
 
+import asyncio
+import logging
 import time
 import threading
-import math
-from typing import Optional, Callable, Any
-from dataclasses import dataclass
+from typing import Optional, Callable, Any, Dict, Tuple
 from enum import IntEnum
 
-from .state import RobotState, IMUState, MotorState, FootState, RobotMode
+import numpy as np
+
+from .state import RobotState, RobotMode
+
+# アプリのロガー配下に置き、ハンドラ・レベル設定を共有する
+_logger = logging.getLogger("unitree_go2.go2")
+# 頻繁に呼ばれる経路用に束縛しておく（DEBUG無効時はレベル判定のみで戻る）
+_debug = _logger.debug
 
 
 class SportModeCmd(IntEnum):
@@ -54,21 +61,6 @@ class SportModeCmd(IntEnum):
     STRAIGHTHAND1 = 25 # 握手1
 
 
-@dataclass
-class MoveCommand:
-    """
-    移動コマンド
-
-    Attributes:
-        vx: 前後速度 (m/s) 正:前進, 負:後退
-        vy: 左右速度 (m/s) 正:左, 負:右  
-        vyaw: 旋回角速度 (rad/s) 正:左旋回, 負:右旋回
-    """
-    vx: float = 0.0
-    vy: float = 0.0
-    vyaw: float = 0.0
-
-
 class Go2Client:
     """
     Go2通信クライアント
@@ -86,6 +78,14 @@ class Go2Client:
     MAX_VY = 0.5      # 最大左右速度 (m/s)
     MAX_VYAW = 1.5    # 最大旋回速度 (rad/s)
 
+    # 状態更新・映像の周期（秒）
+    STATE_PERIOD = 0.02  # 50Hz
+    VIDEO_PERIOD = 1 / 30  # ~30fps
+
+    # テスト映像サイズ
+    TEST_FRAME_WIDTH = 640
+    TEST_FRAME_HEIGHT = 480
+
     def __init__(self, robotIp: str = "192.168.123.161"):
         """
         Go2クライアントの初期化
@@ -97,26 +97,52 @@ class Go2Client:
         self.connected = False
         self.state = RobotState()
         
+        # 状態更新のシーケンス番号（奇数の間は更新中）
+        self._seq = 0
+        
         # SDKクライアント
         self._sportClient = None
         self._stateClient = None
         self._videoClient = None
         
+        # コマンド → SportClientのメソッド（SDK接続時に構築）
+        self._sportDispatch: Dict[SportModeCmd, Callable[[], Any]] = {}
+        
         # スレッド制御
         self._running = False
-        self._stateThread: Optional[threading.Thread] = None
-        self._videoThread: Optional[threading.Thread] = None
+        self._workerThread: Optional[threading.Thread] = None
+        self._notifyThread: Optional[threading.Thread] = None
+        
+        # 状態更新の通知（状態ループがセットし、通知スレッドが待つ）
+        self._stateEvent = threading.Event()
         
         # コールバック
         self._stateCallback: Optional[Callable[[RobotState], None]] = None
         self._videoCallback: Optional[Callable[[Any], None]] = None
         
-        # 最新のコマンド
-        self._lastMoveCmd = MoveCommand()
-        self._cmdLock = threading.Lock()
+        # 最新の移動コマンド (vx, vy, vyaw)
+        # タプルごと差し替えるので、参照の代入だけでスレッド間の整合性が取れる
+        self._lastMoveCmd: Tuple[float, float, float] = (0.0, 0.0, 0.0)
         
         # シミュレーションモード（SDK未インストール時）
         self._simulationMode = False
+        
+        # テスト映像の静的部分（背景 + 中央ボックス）とグリッド線の位置
+        cx, cy = self.TEST_FRAME_WIDTH // 2, self.TEST_FRAME_HEIGHT // 2
+        boxW, boxH = 200, 40
+        self._testBox = (
+            slice(cy - boxH // 2, cy + boxH // 2),
+            slice(cx - boxW // 2, cx + boxW // 2),
+        )
+        self._testFrameTemplate = self._buildTestFrameTemplate()
+        self._testFrameBuf = np.empty_like(self._testFrameTemplate)
+        self._gridRows = np.arange(0, self.TEST_FRAME_HEIGHT, 30)
+        self._gridCols = np.arange(0, self.TEST_FRAME_WIDTH, 30)
+        self._gridRowPhase = self._gridRows * 0.01
+        self._gridColPhase = self._gridCols * 0.01
+        
+        # シミュレーション波形テーブル
+        self._buildSimTables()
 
     def connect(self) -> bool:
         """
@@ -143,22 +169,38 @@ class Go2Client:
                 self._sportClient = SportClient()
                 self._sportClient.SetTimeout(5.0)
                 self._sportClient.Init()
+                self._sportDispatch = {
+                    SportModeCmd.STAND_UP: self._sportClient.StandUp,
+                    SportModeCmd.STAND_DOWN: self._sportClient.StandDown,
+                    SportModeCmd.BALANCE_STAND: self._sportClient.BalanceStand,
+                    SportModeCmd.RECOVERY_STAND: self._sportClient.RecoveryStand,
+                    SportModeCmd.STOP_MOVE: self._sportClient.StopMove,
+                    SportModeCmd.DAMP: self._sportClient.Damp,
+                    SportModeCmd.HELLO: self._sportClient.Hello,
+                    SportModeCmd.STRETCH: self._sportClient.Stretch,
+                }
                 
                 self._simulationMode = False
-                print(f"[Go2Client] SDK2で{self.robotIp}に接続しました")
+                _logger.info("SDK2で%sに接続しました", self.robotIp)
                 
             except ImportError as e:
                 # SDKがない場合はシミュレーションモード
-                print(f"[Go2Client] SDK2が見つかりません。シミュレーションモードで起動します: {e}")
+                _logger.warning("SDK2が見つかりません。シミュレーションモードで起動します: %s", e)
                 self._simulationMode = True
 
             self.connected = True
             self.state.connected = True
             
-            # 状態受信スレッドの開始
+            # ワーカースレッドの開始（1つのイベントループで状態と映像のループを実行）
             self._running = True
-            self._stateThread = threading.Thread(target=self._stateLoop, daemon=True)
-            self._stateThread.start()
+            self._workerThread = threading.Thread(
+                target=lambda: asyncio.run(self._workerMain()), daemon=True
+            )
+            self._workerThread.start()
+            
+            # 状態通知スレッドの開始（遅いコールバックが状態ループを止めないように分離）
+            self._notifyThread = threading.Thread(target=self._notifyLoop, daemon=True)
+            self._notifyThread.start()
             
             return True
 
@@ -173,15 +215,16 @@ class Go2Client:
         """
         self._running = False
         
-        if self._stateThread and self._stateThread.is_alive():
-            self._stateThread.join(timeout=2.0)
+        if self._workerThread and self._workerThread.is_alive():
+            self._workerThread.join(timeout=2.0)
         
-        if self._videoThread and self._videoThread.is_alive():
-            self._videoThread.join(timeout=2.0)
+        self._stateEvent.set()
+        if self._notifyThread and self._notifyThread.is_alive():
+            self._notifyThread.join(timeout=2.0)
         
         self.connected = False
         self.state.connected = False
-        print("[Go2Client] 切断しました")
+        _logger.info("切断しました")
 
     def setStateCallback(self, callback: Callable[[RobotState], None]) -> None:
         """
@@ -200,11 +243,6 @@ class Go2Client:
             callback: 映像フレームを受け取るコールバック関数
         """
         self._videoCallback = callback
-        
-        # 映像スレッドの開始
-        if self._running and not self._videoThread:
-            self._videoThread = threading.Thread(target=self._videoLoop, daemon=True)
-            self._videoThread.start()
 
     def move(self, vx: float, vy: float, vyaw: float) -> None:
         """
@@ -223,14 +261,13 @@ class Go2Client:
         vy = max(-self.MAX_VY, min(self.MAX_VY, vy))
         vyaw = max(-self.MAX_VYAW, min(self.MAX_VYAW, vyaw))
         
-        with self._cmdLock:
-            self._lastMoveCmd = MoveCommand(vx, vy, vyaw)
+        self._lastMoveCmd = (vx, vy, vyaw)
         
         if self._sportClient and not self._simulationMode:
             try:
                 self._sportClient.Move(vx, vy, vyaw)
             except Exception as e:
-                print(f"[Go2Client] 移動コマンド送信エラー: vx={vx}, vy={vy}, vyaw={vyaw}, error={e}")
+                _logger.error("移動コマンド送信エラー: vx=%s, vy=%s, vyaw=%s, error=%s", vx, vy, vyaw, e)
 
     def standUp(self) -> None:
         """立ち上がりコマンドを送信"""
@@ -273,7 +310,7 @@ class Go2Client:
         """
         self.stopMove()
         self.damp()
-        print("[Go2Client] ⚠️ 緊急停止を実行しました")
+        _logger.warning("⚠️ 緊急停止を実行しました")
 
     def _sendSportCmd(self, cmd: SportModeCmd) -> None:
         """
@@ -284,102 +321,198 @@ class Go2Client:
         """
         if self._sportClient and not self._simulationMode:
             try:
-                if cmd == SportModeCmd.STAND_UP:
-                    self._sportClient.StandUp()
-                elif cmd == SportModeCmd.STAND_DOWN:
-                    self._sportClient.StandDown()
-                elif cmd == SportModeCmd.BALANCE_STAND:
-                    self._sportClient.BalanceStand()
-                elif cmd == SportModeCmd.RECOVERY_STAND:
-                    self._sportClient.RecoveryStand()
-                elif cmd == SportModeCmd.STOP_MOVE:
-                    self._sportClient.StopMove()
-                elif cmd == SportModeCmd.DAMP:
-                    self._sportClient.Damp()
-                elif cmd == SportModeCmd.HELLO:
-                    self._sportClient.Hello()
-                elif cmd == SportModeCmd.STRETCH:
-                    self._sportClient.Stretch()
+                fn = self._sportDispatch.get(cmd)
+                if fn:
+                    fn()
                 else:
-                    print(f"[Go2Client] 未実装コマンド: {cmd}")
+                    _logger.warning("未実装コマンド: %s", cmd)
             except Exception as e:
-                print(f"[Go2Client] コマンド送信エラー: cmd={cmd}, error={e}")
+                _logger.error("コマンド送信エラー: cmd=%s, error=%s", cmd, e)
         else:
-            print(f"[Go2Client] シミュレーション: {cmd.name}")
+            _debug("シミュレーション: %s", cmd.name)
 
-    def _stateLoop(self) -> None:
+    async def _workerMain(self) -> None:
         """
-        状態受信ループ（別スレッドで実行）
+        ワーカースレッドのイベントループ本体
+
+        状態ループ（50Hz）と映像ループ（30fps）を同じループ上のタスクとして実行する
         """
+        await asyncio.gather(self._stateLoop(), self._videoLoop())
+
+    @staticmethod
+    async def _waitNextTick(nextTick: float, period: float) -> float:
+        """
+        次の周期の締め切りまで待機
+
+        単調時計の締め切りで周期を刻むため、処理時間やスリープの誤差が累積しない
+
+        Args:
+            nextTick: 今回の締め切り時刻 (monotonic)
+            period: 周期（秒）
+
+        Returns:
+            float: 次回の締め切り時刻
+        """
+        nextTick += period
+        delay = nextTick - time.monotonic()
+        if delay < 0:
+            # 周期に遅れた場合は遅れを持ち越さずに刻み直す
+            nextTick = time.monotonic()
+            delay = 0
+        await asyncio.sleep(delay)
+        return nextTick
+
+    async def _stateLoop(self) -> None:
+        """
+        状態受信ループ（ワーカースレッドのイベントループで実行）
+        """
+        nextTick = time.monotonic()
         while self._running:
             try:
-                if self._simulationMode:
-                    # シミュレーションモードではダミーデータを生成
-                    self._updateSimulatedState()
-                else:
-                    # 実際のSDKから状態を取得
-                    self._updateRealState()
-                
-                # コールバック呼び出し
-                if self._stateCallback:
-                    self._stateCallback(self.state.copy())
+                self._seq += 1
+                try:
+                    if self._simulationMode:
+                        # シミュレーションモードではダミーデータを生成
+                        self._updateSimulatedState()
+                    else:
+                        # 実際のSDKから状態を取得
+                        self._updateRealState()
+                finally:
+                    self._seq += 1
                 
-                time.sleep(0.02)  # 50Hz
+                # 通知スレッドを起こすだけで待たない
+                self._stateEvent.set()
                 
             except Exception as e:
-                print(f"[Go2Client] 状態受信エラー: {e}")
-                time.sleep(0.1)
+                _logger.error("状態受信エラー: %s", e)
+                await asyncio.sleep(0.1)
+                nextTick = time.monotonic()
+                continue
+            
+            nextTick = await self._waitNextTick(nextTick, self.STATE_PERIOD)
+
+    def _notifyLoop(self) -> None:
+        """
+        状態通知ループ（別スレッドで実行）
+
+        状態ループからの更新通知を待ち、その時点の最新スナップショットを
+        コールバックへ渡す。コールバックが遅れた間の更新はまとめて1回になる
+        """
+        while self._running:
+            if not self._stateEvent.wait(timeout=0.1):
+                continue
+            # 先にクリアするので、読み取り中の更新は次の通知で拾われる
+            self._stateEvent.clear()
+            
+            callback = self._stateCallback
+            if not callback or not self._running:
+                continue
+            try:
+                callback(self.snapshotState())
+            except Exception as e:
+                _logger.error("状態通知エラー: %s", e)
+
+    def snapshotState(self) -> RobotState:
+        """
+        状態のスナップショットを取得
+
+        シーケンス番号で更新中の読み取りを検出して再試行する（seqlock）
+
+        Returns:
+            RobotState: 状態のスナップショット
+        """
+        while True:
+            seq = self._seq
+            if seq & 1:
+                # 更新中なので書き込み側に譲る
+                time.sleep(0)
+                continue
+            
+            snap = self.state.copy()
+            if self._seq == seq:
+                return snap
+
+    def _buildSimTables(self) -> None:
+        """
+        シミュレーション波形テーブルを構築
+
+        各値を offset + amp * sin(omega * t + phase) で表し、1回のベクトル演算で評価する。
+        並び: 電圧, 電流, rpy, gyro, accel, 足の力 x4, モーター q/dq/温度/トルク x12
+        """
+        halfPi = np.pi / 2
+        idx = np.arange(12)
+        feet = np.arange(4)
+        
+        # 電圧, 電流, roll, pitch, yaw, gyro xyz, accel xyz
+        omegas = [0.1, 0.5, 2.0, 1.5, 0.3, 2.0, 1.5, 0.3, 1.0, 1.0, 3.0]
+        phases = [0.0, 0.0, 0.0, 0.0, 0.0, halfPi, halfPi, halfPi, 0.0, halfPi, 0.0]
+        amps = [0.5, 1.0, 0.05, 0.03, 0.1, 0.1, 0.06, 0.2, 0.5, 0.3, 0.1]
+        offsets = [25.0, 2.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 9.81]
+        
+        # 項目ごとの (omega, phase, amp, offset)
+        groups = [
+            (np.array(omegas), np.array(phases), np.array(amps), np.array(offsets)),
+            (3.0, feet.astype(float), 20.0, 50.0),   # 足の力
+            (1.0, idx * 0.5, 0.3, 0.0),              # モーター q
+            (1.0, idx * 0.5 + halfPi, 0.2, 0.0),     # モーター dq (cos)
+            (0.1, idx.astype(float), 5.0, 35.0),     # モーター温度
+            (2.0, idx.astype(float), 2.0, 0.0),      # モータートルク
+        ]
+        cols = [[], [], [], []]
+        for group in groups:
+            n = np.size(group[1])
+            for col, v in zip(cols, group):
+                col.append(np.broadcast_to(np.asarray(v, dtype=np.float64), (n,)))
+        
+        # UI表示用なのでfloat32で十分。位相が潰れないよう、tは生成時刻からの経過秒にする
+        self._simOmegas, self._simPhases, self._simAmps, self._simOffsets = (
+            np.concatenate(col).astype(np.float32) for col in cols
+        )
+        self._simEpoch = time.time()
+        self._footIds = np.arange(4)
 
     def _updateSimulatedState(self) -> None:
         """
         シミュレーション用のダミー状態を生成
         """
         t = time.time()
+        state = self.state
+        imu = state.imu
+        
+        # 全波形を1回のベクトル演算で評価（float32）
+        wave = (
+            np.sin(self._simOmegas * np.float32(t - self._simEpoch) + self._simPhases)
+            * self._simAmps
+            + self._simOffsets
+        )
+        vals = wave[:15].tolist()
         
         # バッテリー（徐々に減少するシミュレーション）
-        self.state.batteryLevel = max(20, 100 - int((t % 1000) / 10))
-        self.state.batteryVoltage = 25.0 + math.sin(t * 0.1) * 0.5
-        self.state.batteryCurrent = 2.0 + math.sin(t * 0.5) * 1.0
+        state.batteryLevel = max(20, 100 - int((t % 1000) / 10))
+        state.batteryVoltage, state.batteryCurrent = vals[0:2]
         
         # IMU（微小な揺れをシミュレーション）
-        self.state.imu.rpy = [
-            math.sin(t * 2) * 0.05,  # roll
-            math.sin(t * 1.5) * 0.03,  # pitch
-            math.sin(t * 0.3) * 0.1,  # yaw
-        ]
-        self.state.imu.gyroscope = [
-            math.cos(t * 2) * 0.1,
-            math.cos(t * 1.5) * 0.06,
-            math.cos(t * 0.3) * 0.2,
-        ]
-        self.state.imu.accelerometer = [
-            math.sin(t) * 0.5,
-            math.cos(t) * 0.3,
-            9.81 + math.sin(t * 3) * 0.1,
-        ]
-        
-        # モーター状態
-        for i, motor in enumerate(self.state.motors):
-            motor.q = math.sin(t + i * 0.5) * 0.3
-            motor.dq = math.cos(t + i * 0.5) * 0.2
-            motor.temperature = 35 + math.sin(t * 0.1 + i) * 5
-            motor.tauEst = math.sin(t * 2 + i) * 2.0
+        imu.setRpy(*vals[2:5])
+        imu.gyroscope[:] = vals[5:8]
+        imu.accelerometer[:] = vals[8:11]
         
         # 足接地状態
-        for i, foot in enumerate(self.state.feet):
-            foot.contact = (int(t * 2) + i) % 2 == 0
-            foot.force = 50 + math.sin(t * 3 + i) * 20 if foot.contact else 0
+        feet = state.feet
+        feet.contact[:] = (int(t * 2) + self._footIds) % 2 == 0
+        np.multiply(wave[11:15], feet.contact, out=feet.force)
+        
+        # モーター状態（配列単位で一括更新）
+        motors = state.motors
+        motors.setQ(wave[15:27])
+        motors.dq[:] = wave[27:39]
+        motors.temperature[:] = wave[39:51]
+        motors.tauEst[:] = wave[51:63]
         
         # 移動速度（コマンドを反映）
-        with self._cmdLock:
-            self.state.velocity = [
-                self._lastMoveCmd.vx,
-                self._lastMoveCmd.vy,
-                self._lastMoveCmd.vyaw,
-            ]
+        self.state.velocity[:] = self._lastMoveCmd
         
         # モード
-        self.state.mode = RobotMode.STAND_UP
+        self.state.mode = int(RobotMode.STAND_UP)
         self.state.timestamp = t
 
     def _updateRealState(self) -> None:
@@ -394,16 +527,22 @@ class Go2Client:
             pass
             
         except Exception as e:
-            print(f"[Go2Client] 状態取得エラー: {e}")
+            _logger.error("状態取得エラー: %s", e)
 
-    def _videoLoop(self) -> None:
+    async def _videoLoop(self) -> None:
         """
-        映像受信ループ（別スレッドで実行）
+        映像受信ループ（ワーカースレッドのイベントループで実行）
         """
-        import numpy as np
-        
+        nextTick = time.monotonic()
         while self._running:
             try:
+                # 受け取り手がいない間はフレームを生成しない
+                callback = self._videoCallback
+                if callback is None:
+                    await asyncio.sleep(0.1)
+                    nextTick = time.monotonic()
+                    continue
+                
                 if self._simulationMode:
                     # シミュレーションモードではダミー映像を生成
                     frame = self._generateTestFrame()
@@ -411,49 +550,61 @@ class Go2Client:
                     # 実際のカメラから映像を取得
                     frame = self._captureRealFrame()
                 
-                if frame is not None and self._videoCallback:
-                    self._videoCallback(frame)
-                
-                time.sleep(0.033)  # ~30fps
+                if frame is not None:
+                    callback(frame)
                 
             except Exception as e:
-                print(f"[Go2Client] 映像受信エラー: {e}")
-                time.sleep(0.1)
+                _logger.error("映像受信エラー: %s", e)
+                await asyncio.sleep(0.1)
+                nextTick = time.monotonic()
+                continue
+            
+            nextTick = await self._waitNextTick(nextTick, self.VIDEO_PERIOD)
+
+    def _buildTestFrameTemplate(self) -> np.ndarray:
+        """
+        テスト映像の静的部分を生成
+
+        Returns:
+            numpy.ndarray: 黒背景に中央ボックスを描いたフレーム
+        """
+        template = np.zeros(
+            (self.TEST_FRAME_HEIGHT, self.TEST_FRAME_WIDTH, 3), dtype=np.uint8
+        )
+        
+        # 中央に「SIMULATION」テキスト位置のボックス
+        template[self._testBox] = (30, 30, 50)
+        return template
 
     def _generateTestFrame(self) -> Any:
         """
         テスト用のダミー映像フレームを生成
 
+        静的部分はテンプレートからコピーし、時間変化する部分だけを描画する
+
         Returns:
             numpy.ndarray: テスト映像フレーム (640x480 RGB)
         """
-        import numpy as np
-        
         t = time.time()
-        width, height = 640, 480
-        
-        # グラデーション背景
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
+        frame = self._testFrameBuf
+        template = self._testFrameTemplate
+        np.copyto(frame, template)
         
-        # サイバーパンク風のグリッドパターン
-        gridColor = (0, 255, 255)  # シアン
-        for y in range(0, height, 30):
-            alpha = int(50 + 30 * math.sin(t + y * 0.01))
-            frame[y:y+1, :] = (0, alpha, alpha)
-        for x in range(0, width, 30):
-            alpha = int(50 + 30 * math.sin(t + x * 0.01))
-            frame[:, x:x+1] = (0, alpha, alpha)
+        # サイバーパンク風のグリッドパターン（シアン、明るさが位置と時間で変化）
+        rowAlpha = (50 + 30 * np.sin(t + self._gridRowPhase)).astype(np.uint8)
+        colAlpha = (50 + 30 * np.sin(t + self._gridColPhase)).astype(np.uint8)
+        frame[self._gridRows, :, 1:] = rowAlpha[:, None, None]
+        frame[:, self._gridCols, 1:] = colAlpha[None, :, None]
         
-        # 中央に「SIMULATION」テキスト位置のボックス
-        cx, cy = width // 2, height // 2
-        boxW, boxH = 200, 40
-        frame[cy-boxH//2:cy+boxH//2, cx-boxW//2:cx+boxW//2] = (30, 30, 50)
+        # 中央ボックスはグリッドより手前
+        frame[self._testBox] = template[self._testBox]
         
         # 走査線効果
-        scanY = int((t * 100) % height)
-        frame[scanY:scanY+2, :] = frame[scanY:scanY+2, :] + 50
+        scanY = int((t * 100) % self.TEST_FRAME_HEIGHT)
+        frame[scanY:scanY+2, :] += 50
         
-        return frame
+        # 呼び出し側がフレームを保持するためコピーを返す
+        return frame.copy()
 
     def _captureRealFrame(self) -> Any:
         """
@@ -0,0 +1,87 @@
+"""
+通信用イベントループ
+
+WebRTCClient・WebSocketClientが共有するasyncioイベントループを提供する
+
+主な機能:
+- バックグラウンドスレッド1本でイベントループを実行（初回利用時に起動）
+- uvloopがあればlibuvベースのループを使用
+- 通信スレッドを空いているCPUコアに固定
+
+制限事項:
+- ループはプロセス終了まで動き続ける（デーモンスレッド）
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Optional
+
+# uvloop（オプション: 高速イベントループ）
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+_logger = logging.getLogger("unitree_go2.io")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loopLock = threading.Lock()
+
+
+def getIoLoop() -> asyncio.AbstractEventLoop:
+    """
+    共有イベントループを取得（未起動なら起動する）
+
+    Returns:
+        asyncio.AbstractEventLoop: 実行中のイベントループ
+    """
+    global _loop
+    with _loopLock:
+        if _loop is None:
+            # グローバルなポリシーは変えず、このループだけuvloopにする
+            loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+            started = threading.Event()
+            thread = threading.Thread(
+                target=_runLoop, args=(loop, started), name="robot-io", daemon=True
+            )
+            thread.start()
+            started.wait()
+            _loop = loop
+        return _loop
+
+
+def _runLoop(loop: asyncio.AbstractEventLoop, started: threading.Event) -> None:
+    """
+    イベントループスレッドのエントリ
+
+    Args:
+        loop: 実行するイベントループ
+        started: ループ開始の通知
+    """
+    _pinToLastCore()
+    asyncio.set_event_loop(loop)
+    loop.call_soon(started.set)
+    loop.run_forever()
+
+
+def _pinToLastCore() -> None:
+    """
+    呼び出し元スレッドを最後のCPUコアに固定
+
+    UIスレッドと別コアで通信処理を動かすため。
+    コアが1つの環境やsched_setaffinity非対応のOSでは何もしない
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        # プロセスに許可されたコアの中から選ぶ
+        cores = os.sched_getaffinity(0)
+        if len(cores) < 2:
+            return
+        # Linuxではスレッド単位で設定される
+        os.sched_setaffinity(threading.get_native_id(), {max(cores)})
+    except OSError as e:
+        _logger.warning("CPUアフィニティ設定失敗: %s", e)
@@ -13,10 +13,36 @@ Go2のセンサー情報やモーター状態を管理するデータクラス
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Optional
 from enum import IntEnum
+import math
 import time
 
+import numpy as np
+
+
+# ラジアン → 度
+_RAD2DEG = 180.0 / math.pi
+
+
+def quatToRpy(w: float, x: float, y: float, z: float) -> tuple:
+    """
+    クォータニオンからロール・ピッチ・ヨー角を直接計算
+
+    回転行列を経由せず、ZYX（yaw-pitch-roll）順のオイラー角を求める
+
+    Args:
+        w, x, y, z: クォータニオン成分
+
+    Returns:
+        tuple: (roll, pitch, yaw) (rad)
+    """
+    sinp = 2.0 * (w * y - z * x)
+    pitch = math.asin(max(-1.0, min(1.0, sinp)))
+    roll = math.atan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y))
+    yaw = math.atan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+    return (roll, pitch, yaw)
+
 
 class RobotMode(IntEnum):
     """
@@ -33,11 +59,36 @@ class RobotMode(IntEnum):
     UNKNOWN = -1      # 不明
 
 
-@dataclass
+# 動作モードの表示名（RobotModeの値 0..5 でインデックス）
+_MODE_STR = ("IDLE", "DOWN", "STAND", "WALK", "RUN", "CLIMB")
+
+# デフォルト値の雛形（ファクトリではコピーのみ行う）
+_IDENTITY_QUAT = np.array([1.0, 0.0, 0.0, 0.0])
+_GRAVITY_ACCEL = np.array([0.0, 0.0, 9.81])
+
+
+def _zeros3() -> np.ndarray:
+    """3要素のゼロベクトルを生成"""
+    return np.zeros(3)
+
+
+def _identityQuat() -> np.ndarray:
+    """単位クォータニオンを生成"""
+    return _IDENTITY_QUAT.copy()
+
+
+def _gravityAccel() -> np.ndarray:
+    """静止時の加速度ベクトルを生成"""
+    return _GRAVITY_ACCEL.copy()
+
+
+@dataclass(slots=True)
 class IMUState:
     """
     IMU（慣性計測装置）の状態
 
+    ベクトル量は固定長のfloat64配列（要素の書き換えはインプレースで行う）
+
     Attributes:
         quaternion: クォータニオン [w, x, y, z]
         gyroscope: 角速度 [x, y, z] (rad/s)
@@ -45,32 +96,46 @@ class IMUState:
         rpy: ロール・ピッチ・ヨー角 [roll, pitch, yaw] (rad)
         temperature: センサー温度 (℃)
     """
-    quaternion: List[float] = field(default_factory=lambda: [1.0, 0.0, 0.0, 0.0])
-    gyroscope: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
-    accelerometer: List[float] = field(default_factory=lambda: [0.0, 0.0, 9.81])
-    rpy: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    quaternion: np.ndarray = field(default_factory=_identityQuat)
+    gyroscope: np.ndarray = field(default_factory=_zeros3)
+    accelerometer: np.ndarray = field(default_factory=_gravityAccel)
+    rpy: np.ndarray = field(default_factory=_zeros3)
     temperature: float = 25.0
 
+    def setRpy(self, roll: float, pitch: float, yaw: float) -> None:
+        """
+        姿勢角を設定
+
+        Args:
+            roll: ロール角 (rad)
+            pitch: ピッチ角 (rad)
+            yaw: ヨー角 (rad)
+        """
+        self.rpy[:] = (roll, pitch, yaw)
+
+    @property
+    def rpyDeg(self) -> tuple:
+        """ロール・ピッチ・ヨー角（度、rpyから都度換算）"""
+        roll, pitch, yaw = self.rpy.tolist()
+        return (roll * _RAD2DEG, pitch * _RAD2DEG, yaw * _RAD2DEG)
+
     @property
     def rollDeg(self) -> float:
         """ロール角（度）"""
-        import math
-        return math.degrees(self.rpy[0])
+        return self.rpy.item(0) * _RAD2DEG
 
     @property
     def pitchDeg(self) -> float:
         """ピッチ角（度）"""
-        import math
-        return math.degrees(self.rpy[1])
+        return self.rpy.item(1) * _RAD2DEG
 
     @property
     def yawDeg(self) -> float:
         """ヨー角（度）"""
-        import math
-        return math.degrees(self.rpy[2])
+        return self.rpy.item(2) * _RAD2DEG
 
 
-@dataclass
+@dataclass(slots=True)
 class MotorState:
     """
     単一モーターの状態
@@ -94,14 +159,146 @@ class MotorState:
     temperature: float = 25.0
     lost: bool = False
 
+    def setQ(self, q: float) -> None:
+        """
+        関節角度を設定
+
+        Args:
+            q: 関節角度 (rad)
+        """
+        self.q = q
+
     @property
     def qDeg(self) -> float:
-        """関節角度（度）"""
-        import math
-        return math.degrees(self.q)
+        """関節角度（度、qから都度換算）"""
+        return self.q * _RAD2DEG
+
+
+class MotorArray:
+    """
+    全モーターの状態（構造体配列）
+
+    項目ごとに長さ12のNumPy配列を持ち、受信データを配列単位で一括更新できる。
+    motors[i] で従来のMotorStateと同じ属性名を持つビューを取得できる
+
+    Attributes:
+        motorId: モーターID
+        mode: モーターモード
+        q: 関節角度 (rad)
+        dq: 関節角速度 (rad/s)
+        ddq: 関節角加速度 (rad/s^2)
+        tauEst: 推定トルク (Nm)
+        temperature: モーター温度 (℃)
+        lost: 通信ロスト状態
+    """
 
+    FIELDS = ("motorId", "mode", "q", "dq", "ddq", "tauEst", "temperature", "lost")
+    __slots__ = FIELDS
 
-@dataclass
+    def __init__(self, count: int = 12):
+        """
+        モーター配列の初期化
+
+        Args:
+            count: モーター数
+        """
+        self.motorId = np.arange(count, dtype=np.int32)
+        self.mode = np.zeros(count, dtype=np.int32)
+        self.q = np.zeros(count)
+        self.dq = np.zeros(count)
+        self.ddq = np.zeros(count)
+        self.tauEst = np.zeros(count)
+        self.temperature = np.full(count, 25.0)
+        self.lost = np.zeros(count, dtype=np.bool_)
+
+    def setQ(self, q) -> None:
+        """
+        全関節角度を設定
+
+        Args:
+            q: 関節角度の配列 (rad)
+        """
+        self.q[:] = q
+
+    @property
+    def qDeg(self) -> np.ndarray:
+        """全関節角度（度、qから都度換算した新しい配列）"""
+        return self.q * _RAD2DEG
+
+    def copy(self) -> "MotorArray":
+        """
+        配列ごとにコピーを作成
+
+        Returns:
+            MotorArray: コピーされたモーター配列
+        """
+        other = MotorArray.__new__(MotorArray)
+        for name in self.FIELDS:
+            setattr(other, name, getattr(self, name).copy())
+        return other
+
+    def __len__(self) -> int:
+        return len(self.q)
+
+    def __getitem__(self, index: int) -> "MotorView":
+        if not -len(self.q) <= index < len(self.q):
+            raise IndexError(index)
+        return MotorView(self, index % len(self.q))
+
+    def __iter__(self):
+        for i in range(len(self.q)):
+            yield MotorView(self, i)
+
+
+def _viewField(name: str) -> property:
+    """ビューの属性（元の構造体配列の該当要素を読み書きする）"""
+    def fget(self) -> Any:
+        return getattr(self._array, name)[self._index].item()
+
+    def fset(self, value: Any) -> None:
+        getattr(self._array, name)[self._index] = value
+
+    return property(fget, fset)
+
+
+class MotorView:
+    """
+    MotorArray中の1モーターへのビュー
+
+    MotorStateと同じ属性名で読み書きでき、書き込みは元の配列に反映される
+    """
+
+    __slots__ = ("_array", "_index")
+
+    motorId = _viewField("motorId")
+    mode = _viewField("mode")
+    q = _viewField("q")
+    dq = _viewField("dq")
+    ddq = _viewField("ddq")
+    tauEst = _viewField("tauEst")
+    temperature = _viewField("temperature")
+    lost = _viewField("lost")
+
+    def __init__(self, motors: MotorArray, index: int):
+        self._array = motors
+        self._index = index
+
+    def setQ(self, q: float) -> None:
+        """
+        関節角度を設定
+
+        Args:
+            q: 関節角度 (rad)
+        """
+        self.q = q
+
+    @property
+    def qDeg(self) -> float:
+        """関節角度（度、qから都度換算）"""
+        return self.q * _RAD2DEG
+
+
+@dataclass(slots=True)
 class FootState:
     """
     足の状態
@@ -116,7 +313,77 @@ class FootState:
     force: float = 0.0
 
 
-@dataclass
+class FootArray:
+    """
+    全足の状態（構造体配列）
+
+    項目ごとに長さ4のNumPy配列を持ち、受信データを配列単位で一括更新できる。
+    feet[i] で従来のFootStateと同じ属性名を持つビューを取得できる
+
+    Attributes:
+        footId: 足ID (0: FR, 1: FL, 2: RR, 3: RL)
+        contact: 接地状態
+        force: 接地力 (N)
+    """
+
+    FIELDS = ("footId", "contact", "force")
+    __slots__ = FIELDS
+
+    def __init__(self, count: int = 4):
+        """
+        足配列の初期化
+
+        Args:
+            count: 足の数
+        """
+        self.footId = np.arange(count, dtype=np.int32)
+        self.contact = np.zeros(count, dtype=np.bool_)
+        self.force = np.zeros(count)
+
+    def copy(self) -> "FootArray":
+        """
+        配列ごとにコピーを作成
+
+        Returns:
+            FootArray: コピーされた足配列
+        """
+        other = FootArray.__new__(FootArray)
+        for name in self.FIELDS:
+            setattr(other, name, getattr(self, name).copy())
+        return other
+
+    def __len__(self) -> int:
+        return len(self.force)
+
+    def __getitem__(self, index: int) -> "FootView":
+        if not -len(self.force) <= index < len(self.force):
+            raise IndexError(index)
+        return FootView(self, index % len(self.force))
+
+    def __iter__(self):
+        for i in range(len(self.force)):
+            yield FootView(self, i)
+
+
+class FootView:
+    """
+    FootArray中の1足へのビュー
+
+    FootStateと同じ属性名で読み書きでき、書き込みは元の配列に反映される
+    """
+
+    __slots__ = ("_array", "_index")
+
+    footId = _viewField("footId")
+    contact = _viewField("contact")
+    force = _viewField("force")
+
+    def __init__(self, feet: FootArray, index: int):
+        self._array = feet
+        self._index = index
+
+
+@dataclass(slots=True)
 class RobotState:
     """
     ロボット全体の状態
@@ -126,19 +393,19 @@ class RobotState:
     Attributes:
         timestamp: データ取得時刻
         connected: 接続状態
-        mode: 動作モード
+        mode: 動作モード（RobotModeの値をintで保持）
         batteryLevel: バッテリー残量 (%)
         batteryCurrent: バッテリー電流 (A)
         batteryVoltage: バッテリー電圧 (V)
         imu: IMU状態
-        motors: モーター状態リスト (12個)
-        feet: 足状態リスト (4個)
-        velocity: 現在速度 [vx, vy, vyaw]
-        position: 現在位置 [x, y, z]
+        motors: モーター状態 (12個、構造体配列)
+        feet: 足状態 (4個、構造体配列)
+        velocity: 現在速度 [vx, vy, vyaw]（float64配列）
+        position: 現在位置 [x, y, z]（float64配列）
     """
     timestamp: float = field(default_factory=time.time)
     connected: bool = False
-    mode: RobotMode = RobotMode.UNKNOWN
+    mode: int = -1  # RobotMode.UNKNOWN
     
     # バッテリー情報
     batteryLevel: int = 0
@@ -150,18 +417,14 @@ class RobotState:
     imu: IMUState = field(default_factory=IMUState)
     
     # モーター (12個: 各足3関節 × 4足)
-    motors: List[MotorState] = field(default_factory=lambda: [
-        MotorState(motorId=i) for i in range(12)
-    ])
+    motors: MotorArray = field(default_factory=MotorArray)
     
     # 足状態 (4足: FR, FL, RR, RL)
-    feet: List[FootState] = field(default_factory=lambda: [
-        FootState(footId=i) for i in range(4)
-    ])
+    feet: FootArray = field(default_factory=FootArray)
     
     # 速度・位置
-    velocity: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
-    position: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    velocity: np.ndarray = field(default_factory=_zeros3)
+    position: np.ndarray = field(default_factory=_zeros3)
     
     # エラー状態
     errorCode: int = 0
@@ -171,40 +434,50 @@ class RobotState:
         """
         状態のディープコピーを作成
 
+        deepcopyの汎用処理を避け、各データクラスを直接構築する
+
         Returns:
             RobotState: コピーされた状態オブジェクト
         """
-        import copy
-        return copy.deepcopy(self)
+        imu = self.imu
+        return RobotState(
+            timestamp=self.timestamp,
+            connected=self.connected,
+            mode=self.mode,
+            batteryLevel=self.batteryLevel,
+            batteryCurrent=self.batteryCurrent,
+            batteryVoltage=self.batteryVoltage,
+            batteryTemperature=self.batteryTemperature,
+            imu=IMUState(
+                quaternion=imu.quaternion.copy(),
+                gyroscope=imu.gyroscope.copy(),
+                accelerometer=imu.accelerometer.copy(),
+                rpy=imu.rpy.copy(),
+                temperature=imu.temperature,
+            ),
+            motors=self.motors.copy(),
+            feet=self.feet.copy(),
+            velocity=self.velocity.copy(),
+            position=self.position.copy(),
+            errorCode=self.errorCode,
+            errorMessage=self.errorMessage,
+        )
 
     @property
     def modeStr(self) -> str:
         """動作モードの文字列表現"""
-        modeNames = {
-            RobotMode.IDLE: "IDLE",
-            RobotMode.STAND_DOWN: "DOWN",
-            RobotMode.STAND_UP: "STAND",
-            RobotMode.WALKING: "WALK",
-            RobotMode.RUNNING: "RUN",
-            RobotMode.CLIMBING: "CLIMB",
-            RobotMode.UNKNOWN: "---",
-        }
-        return modeNames.get(self.mode, "UNKNOWN")
+        mode = self.mode
+        if 0 <= mode < len(_MODE_STR):
+            return _MODE_STR[mode]
+        return "---" if mode == -1 else "UNKNOWN"
 
     @property
     def isHealthy(self) -> bool:
         """ロボットの健全性チェック"""
-        # バッテリー低下チェック
-        if self.batteryLevel < 10:
-            return False
-        # エラーコードチェック
-        if self.errorCode != 0:
+        # バッテリー低下・エラーコードチェック
+        if self.batteryLevel < 10 or self.errorCode != 0:
             return False
-        # モーター異常チェック
-        for motor in self.motors:
-            if motor.temperature > 80:  # 80℃以上は異常
-                return False
-            if motor.lost:
-                return False
-        return True
+        # モーター異常チェック（80℃以上または通信ロスト）
+        motors = self.motors
+        return not (motors.temperature.max() > 80 or motors.lost.any())
 
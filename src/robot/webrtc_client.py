@@ -24,25 +24,57 @@ MCFモード (v1.1.7+):
 """
 
 import asyncio
+import concurrent.futures
+import logging
 import threading
 import time
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Tuple
 from enum import Enum
 
-from .state import RobotState, IMUState, FootState, RobotMode
+import numpy as np
+
+from .state import RobotState, IMUState, FootState, RobotMode, quatToRpy
+from .io_loop import getIoLoop
 from .go2_commands import (
     RtcTopic, SportCmd, ObstacleAvoidCmd, GaitType, SpeedLevel,
     move_params, euler_params, special_action_params, obstacle_avoid_params
 )
 
+# アプリのロガー配下に置き、ハンドラ・レベル設定を共有する
+_logger = logging.getLogger("unitree_go2.webrtc")
+# コマンド送信毎に呼ばれるため束縛しておく（DEBUG無効時はレベル判定のみで戻る）
+_debug = _logger.debug
+
 # WebRTC接続ライブラリ
 try:
     from unitree_webrtc_connect import Go2WebRTCConnection, WebRTCConnectionMethod
     WEBRTC_AVAILABLE = True
 except ImportError:
     WEBRTC_AVAILABLE = False
-    print("[WebRTCClient] unitree_webrtc_connectがインストールされていません")
-    print("  pip install unitree_webrtc_connect")
+    _logger.warning("unitree_webrtc_connectがインストールされていません (pip install unitree_webrtc_connect)")
+
+# JSONデコーダ（orjsonがあれば高速なC実装を使用）
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# 定数リクエスト（インポート時に一度だけ作成。ライブラリ側では読み取りのみ）
+# パラメータなしコマンド
+_SPORT_REQUESTS = {cmd: {"api_id": cmd} for cmd in SportCmd}
+# 特殊動作（parameter: {"data": True}、_doSpecialAction()で送るコマンドのみ）
+_SPECIAL_ACTIONS = (
+    SportCmd.BACK_FLIP, SportCmd.FRONT_FLIP, SportCmd.LEFT_FLIP, SportCmd.RIGHT_FLIP,
+    SportCmd.HAND_STAND, SportCmd.FRONT_JUMP, SportCmd.SIT, SportCmd.STRETCH,
+    SportCmd.DANCE_1, SportCmd.DANCE_2, SportCmd.BARK, SportCmd.GREETING,
+    SportCmd.SHAKE_HAND, SportCmd.HIGH_FIVE, SportCmd.WAVE_HAND, SportCmd.FINGER_HEART,
+    SportCmd.NAP, SportCmd.WIGGLE_HIPS,
+)
+_SPECIAL_REQUESTS = {
+    cmd: {"api_id": cmd, "parameter": special_action_params()} for cmd in _SPECIAL_ACTIONS
+}
 
 
 class ConnectionMode(Enum):
@@ -65,6 +97,18 @@ class WebRTCClient:
         obstacleAvoidEnabled: 障害物回避の状態
     """
 
+    # この値を超える接地力を接地とみなす
+    FOOT_CONTACT_FORCE = 20
+
+    # 状態コールバックの最小間隔（ナノ秒、最大20Hz）
+    STATE_INTERVAL_NS = 50_000_000
+
+    # 移動コマンドの最小送信間隔（秒）
+    MOVE_INTERVAL = 0.02
+
+    # 1回にまとめて送信するコマンドの最大数
+    MAX_REQUEST_BATCH = 16
+
     def __init__(
         self,
         robotIp: Optional[str] = None,
@@ -85,11 +129,27 @@ class WebRTCClient:
         
         self.connected = False
         self._conn: Optional[Any] = None
+        # 接続時に一度だけ解決するpublish_request_new（コマンド毎の属性参照を省く）
+        self._publish: Optional[Callable[[str, dict], Any]] = None
         
         # スレッド制御
         self._running = False
         self._eventLoop: Optional[asyncio.AbstractEventLoop] = None
-        self._asyncThread: Optional[threading.Thread] = None
+        self._connectFuture: Optional[concurrent.futures.Future] = None
+        self._stopEvent: Optional[asyncio.Event] = None
+        
+        # 接続処理の完了通知（成功・失敗どちらでもセット）
+        self._connectDone = threading.Event()
+        
+        # 移動コマンドの合流（最新値だけを保持し、送信タスクが一定間隔で送る）
+        # move()は呼び出し元スレッド、送信タスクはイベントループで動く
+        self._pendingMove: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+        self._moveSeq = 0            # move()ごとに増える
+        self._moveSenderIdle = False  # 送信タスクが待機中か
+        self._moveEvent: Optional[asyncio.Event] = None
+        
+        # 移動以外のコマンドの送信キュー（イベントループ上で作成）
+        self._requestQueue: Optional[asyncio.Queue] = None
         
         # コールバック
         self._stateCallback: Optional[Callable[[RobotState], None]] = None
@@ -97,7 +157,9 @@ class WebRTCClient:
         
         # 状態
         self.state = RobotState()
-        self._lastStateTime = 0
+        self._lastStateNs = 0  # 最後に通知した時刻 (monotonic_ns)
+        # 単調時計 → 壁時計の換算（時刻の読み出しを受信ごとに1回にする）
+        self._wallOffsetNs = time.time_ns() - time.monotonic_ns()
         
         # 障害物回避
         self.obstacleAvoidEnabled = False
@@ -110,44 +172,40 @@ class WebRTCClient:
             bool: 接続成功時True
         """
         if not WEBRTC_AVAILABLE:
-            print("[WebRTCClient] WebRTCライブラリが利用できません")
+            _logger.error("WebRTCライブラリが利用できません")
             return False
         
-        print(f"[WebRTCClient] 接続中... (モード: {self.connectionMode.value})")
+        _logger.info("接続中... (モード: %s)", self.connectionMode.value)
         
         try:
-            # 非同期ループをバックグラウンドスレッドで実行
+            # 共有の通信用イベントループ上で接続処理を実行
             self._running = True
-            self._asyncThread = threading.Thread(target=self._runAsyncLoop, daemon=True)
-            self._asyncThread.start()
+            self._connectDone.clear()
+            self._eventLoop = getIoLoop()
+            self._connectFuture = asyncio.run_coroutine_threadsafe(
+                self._asyncConnect(), self._eventLoop
+            )
             
             # 接続待ち（最大10秒）
-            for _ in range(100):
-                if self.connected:
-                    return True
-                time.sleep(0.1)
-            
-            print("[WebRTCClient] 接続タイムアウト")
-            return False
+            if not self._connectDone.wait(timeout=10.0):
+                _logger.warning("接続タイムアウト")
+                return False
+            return self.connected
             
         except Exception as e:
-            print(f"[WebRTCClient] 接続エラー: {e}")
+            _logger.error("接続エラー: %s", e)
             return False
 
-    def _runAsyncLoop(self) -> None:
-        """非同期イベントループを実行"""
-        self._eventLoop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._eventLoop)
-        
-        try:
-            self._eventLoop.run_until_complete(self._asyncConnect())
-        except Exception as e:
-            print(f"[WebRTCClient] 非同期ループエラー: {e}")
-        finally:
-            self._eventLoop.close()
-
     async def _asyncConnect(self) -> None:
         """非同期接続処理"""
+        self._wallOffsetNs = time.time_ns() - time.monotonic_ns()
+        self._stopEvent = asyncio.Event()
+        self._moveEvent = asyncio.Event()
+        self._requestQueue = asyncio.Queue()
+        moveTask: Optional[asyncio.Task] = None
+        requestTask: Optional[asyncio.Task] = None
+        # 接続前の値を基準にし、接続直後のmove()も送信対象にする
+        startSeq = self._moveSeq
         try:
             # 接続モードに応じてWebRTC接続を作成
             if self.connectionMode == ConnectionMode.LOCAL_AP:
@@ -164,62 +222,323 @@ class WebRTCClient:
                         serialNumber=self.serialNumber
                     )
                 else:
-                    print("[WebRTCClient] STA-LモードにはIPまたはシリアル番号が必要です")
+                    _logger.error("STA-LモードにはIPまたはシリアル番号が必要です")
                     return
             else:
-                print("[WebRTCClient] Remoteモードは未実装です")
+                _logger.error("Remoteモードは未実装です")
                 return
             
             # 接続開始
             await self._conn.connect()
             
+            pubSub = self._conn.datachannel.pub_sub
+            self._publish = pubSub.publish_request_new
+            
             self.connected = True
             self.state.connected = True
-            print("[WebRTCClient] 🚀 WebRTC接続成功！")
+            self._connectDone.set()
+            _logger.info("🚀 WebRTC接続成功！")
+            
+            # 状態トピックの購読（状態は受信時に各コールバックから通知）
+            pubSub.subscribe(RtcTopic.SPORT_STATE, self._onDataMessage)
+            pubSub.subscribe(RtcTopic.LOW_STATE, self._onLowStateMessage)
+            
+            # 移動コマンドの送信タスク
+            moveTask = asyncio.create_task(self._moveSender(startSeq))
+            # その他のコマンドの送信タスク
+            requestTask = asyncio.create_task(self._requestSender())
             
-            # 状態更新ループ
-            while self._running:
-                await self._updateState()
-                await asyncio.sleep(0.05)  # 20Hz
+            # 切断されるまで待機
+            await self._stopEvent.wait()
                 
         except Exception as e:
-            print(f"[WebRTCClient] 接続エラー: {e}")
+            _logger.error("接続エラー: %s", e)
             self.connected = False
+        finally:
+            if moveTask:
+                moveTask.cancel()
+            if requestTask:
+                requestTask.cancel()
+            # 失敗時もconnect()の待機をすぐに解除する
+            self._connectDone.set()
+
+    async def _moveSender(self, sentSeq: int) -> None:
+        """
+        移動コマンド送信タスク
 
-    async def _updateState(self) -> None:
-        """状態を更新"""
-        if not self.connected or not self._conn:
+        move()で更新された最新の速度だけを最大 1/MOVE_INTERVAL Hz で送信する。
+        送信間隔内に届いた古い速度は送らずに捨てる
+
+        Args:
+            sentSeq: 送信済みとみなす_moveSeqの値
+        """
+        while self._running:
+            # 待機に入る前に未送信がないか確認（move()との競合で取りこぼさない）
+            self._moveSenderIdle = True
+            if self._moveSeq == sentSeq:
+                await self._moveEvent.wait()
+            self._moveSenderIdle = False
+            self._moveEvent.clear()
+            
+            sentSeq = self._moveSeq
+            vx, vy, vyaw = self._pendingMove
+            try:
+                if self.obstacleAvoidEnabled:
+                    # 障害物回避付き移動
+                    topic, apiId = RtcTopic.OBSTACLES_AVOID, ObstacleAvoidCmd.MOVE
+                else:
+                    # 通常移動
+                    topic, apiId = RtcTopic.SPORT_MOD, SportCmd.MOVE
+                await self._publish(
+                    topic,
+                    {"api_id": apiId, "parameter": move_params(vx, vy, vyaw)}
+                )
+            except Exception as e:
+                _logger.error("移動コマンド送信エラー: %s", e)
+            
+            await asyncio.sleep(self.MOVE_INTERVAL)
+
+    async def _requestSender(self) -> None:
+        """
+        コマンド送信タスク
+
+        キューに積まれた(トピック, リクエスト)をまとめて取り出し、トピックごとに送信する。
+        同じトピック内は積まれた順に1件ずつ送り（StandUp→BalanceStandなどの順序を守る）、
+        異なるトピックどうしは並行して送る。
+        送信はタスクに分け、応答待ちでキューの取り出しが止まらないようにする
+        """
+        requestQueue = self._requestQueue
+        inFlight = set()
+        # トピックごとの最後の送信タスク（次の送信はこれの完了を待つ）
+        tails = {}
+        while self._running:
+            batch = [await requestQueue.get()]
+            # 溜まっている分も同じターンで取り出す（遅延が伸びないよう上限付き）
+            while len(batch) < self.MAX_REQUEST_BATCH and not requestQueue.empty():
+                batch.append(requestQueue.get_nowait())
+            
+            byTopic = {}
+            for topic, request in batch:
+                byTopic.setdefault(topic, []).append(request)
+            for topic, requests in byTopic.items():
+                previous = tails.get(topic)
+                if previous is not None and previous.done():
+                    previous = None
+                task = asyncio.create_task(self._publishSequence(topic, requests, previous))
+                tails[topic] = task
+                # 完了まで参照を保持（GCで消えないように）
+                inFlight.add(task)
+                task.add_done_callback(inFlight.discard)
+
+    async def _publishSequence(
+        self, topic: str, requests: list, previous: Optional[asyncio.Task]
+    ) -> None:
+        """
+        同じトピックのリクエストを順番に送信
+
+        Args:
+            topic: 送信先トピック
+            requests: リクエスト辞書のリスト（送信順）
+            previous: 先に積まれた同トピックの送信タスク（完了を待ってから送る）
+        """
+        if previous is not None:
+            await asyncio.wait((previous,))
+        for request in requests:
+            await self._publishRequest(topic, request)
+
+    async def _publishRequest(self, topic: str, request: dict) -> None:
+        """
+        リクエストを1件送信
+
+        Args:
+            topic: 送信先トピック
+            request: リクエスト辞書
+        """
+        try:
+            await self._publish(topic, request)
+        except Exception as e:
+            _logger.error("コマンド送信エラー (%s): %s", topic, e)
+
+    def _enqueueRequest(self, topic: str, request: dict) -> None:
+        """
+        リクエストを送信キューに追加（任意のスレッドから呼び出し可）
+
+        未接続時は破棄する
+
+        Args:
+            topic: 送信先トピック
+            request: リクエスト辞書
+        """
+        if not self.connected or self._publish is None:
             return
         
+        loop = self._eventLoop
+        requestQueue = self._requestQueue
+        if loop is None or requestQueue is None:
+            return
         try:
-            self.state.timestamp = time.time()
+            loop.call_soon_threadsafe(requestQueue.put_nowait, (topic, request))
+        except RuntimeError:
+            # イベントループ終了済み
+            pass
+
+    def _queueMove(self, vx: float, vy: float, vyaw: float) -> None:
+        """
+        移動コマンドを送信タスクに渡す（任意のスレッドから呼び出し可）
+
+        Args:
+            vx: 前後速度 (m/s)
+            vy: 左右速度 (m/s)
+            vyaw: 旋回速度 (rad/s)
+        """
+        self._pendingMove = (vx, vy, vyaw)
+        self._moveSeq += 1
+        
+        # 送信タスクが待機中の時だけ起こす（送信間隔中は次のループで拾われる）
+        if self._moveSenderIdle and self._eventLoop and self._moveEvent:
+            try:
+                self._eventLoop.call_soon_threadsafe(self._moveEvent.set)
+            except RuntimeError:
+                # イベントループ終了済み
+                pass
+
+    def _onDataMessage(self, message: Any) -> None:
+        """
+        スポーツモード状態トピックの受信コールバック（イベントループスレッドで実行）
+
+        Args:
+            message: 受信メッセージ（"data"に状態が入る）
+        """
+        self._handleStateMessage(message, self._parseStateMessage)
+
+    def _onLowStateMessage(self, message: Any) -> None:
+        """
+        ローレベル状態トピックの受信コールバック（イベントループスレッドで実行）
+
+        Args:
+            message: 受信メッセージ（"data"に状態が入る）
+        """
+        self._handleStateMessage(message, self._parseLowStateMessage)
+
+    def _handleStateMessage(self, message: Any, parser: Callable[[dict], None]) -> None:
+        """
+        状態メッセージをRobotStateに反映してコールバックに通知
+
+        ライブラリがデコード済みの辞書を渡す場合はそのまま使い、
+        文字列・バイト列の場合のみJSONとして解析する
+
+        Args:
+            message: 受信メッセージ（"data"に状態が入る）
+            parser: データ部をRobotStateに反映する関数
+        """
+        try:
+            if isinstance(message, (bytes, str)):
+                message = _loads(message)
+            data = message.get("data")
+            if not isinstance(data, dict):
+                return
+            parser(data)
+            
+            # 時刻は単調時計を1回だけ読み、タイムスタンプは換算して求める
+            now = time.monotonic_ns()
+            self.state.timestamp = (now + self._wallOffsetNs) * 1e-9
             
-            # コールバック呼び出し
-            if self._stateCallback and time.time() - self._lastStateTime > 0.05:
-                self._lastStateTime = time.time()
+            # コールバック呼び出し（最大20Hz、時刻補正の影響を受けない単調時計で判定）
+            if self._stateCallback and now - self._lastStateNs > self.STATE_INTERVAL_NS:
+                self._lastStateNs = now
                 self._stateCallback(self.state.copy())
-                
         except Exception as e:
-            print(f"[WebRTCClient] 状態更新エラー: {e}")
+            _logger.debug("状態解析エラー: %s", e)
+
+    def _parseStateMessage(self, data: dict) -> None:
+        """
+        スポーツモード状態メッセージをRobotStateに反映
+
+        Args:
+            data: rt/sportmodestate のデータ部
+        """
+        state = self.state
+        
+        # IMU（姿勢角はクォータニオンから直接計算）
+        imuState = data.get("imu_state")
+        if imuState:
+            imu = state.imu
+            quaternion = imuState.get("quaternion")
+            if quaternion and len(quaternion) == 4:
+                imu.quaternion[:] = quaternion
+                imu.setRpy(*quatToRpy(*quaternion))
+            gyroscope = imuState.get("gyroscope")
+            if gyroscope:
+                imu.gyroscope[:] = gyroscope
+            accelerometer = imuState.get("accelerometer")
+            if accelerometer:
+                imu.accelerometer[:] = accelerometer
+            imu.temperature = imuState.get("temperature", imu.temperature)
+        
+        # 速度 [vx, vy, vyaw]・位置
+        velocity = data.get("velocity")
+        if velocity:
+            state.velocity[:] = (velocity[0], velocity[1], data.get("yaw_speed", 0.0))
+        position = data.get("position")
+        if position:
+            state.position[:] = position
+        
+        # 足の接地力
+        footForce = data.get("foot_force")
+        if footForce:
+            feet = state.feet
+            feet.force[:] = footForce[:len(feet)]
+            np.greater(feet.force, self.FOOT_CONTACT_FORCE, out=feet.contact)
+
+    def _parseLowStateMessage(self, data: dict) -> None:
+        """
+        ローレベル状態メッセージをRobotStateに反映
+
+        Args:
+            data: rt/lf/lowstate のデータ部
+        """
+        state = self.state
+        
+        # モーター（先頭12個が脚の関節）
+        motorState = data.get("motor_state")
+        motors = state.motors
+        if motorState and len(motorState) >= len(motors):
+            motorState = motorState[:len(motors)]
+            motors.setQ([m.get("q", 0.0) for m in motorState])
+            motors.dq[:] = [m.get("dq", 0.0) for m in motorState]
+            motors.tauEst[:] = [m.get("tau_est", 0.0) for m in motorState]
+            motors.temperature[:] = [m.get("temperature", 25.0) for m in motorState]
+            motors.lost[:] = [m.get("lost", 0) for m in motorState]
+        
+        # バッテリー（電流はmA）
+        bmsState = data.get("bms_state")
+        if bmsState:
+            state.batteryLevel = bmsState.get("soc", state.batteryLevel)
+            state.batteryCurrent = bmsState.get("current", 0) / 1000.0
+        state.batteryVoltage = data.get("power_v", state.batteryVoltage)
 
     def disconnect(self) -> None:
         """接続を切断"""
-        print("[WebRTCClient] 切断中...")
+        _logger.info("切断中...")
         self._running = False
         
-        if self._conn:
-            if self._eventLoop and self._eventLoop.is_running():
-                asyncio.run_coroutine_threadsafe(
-                    self._asyncDisconnect(),
-                    self._eventLoop
-                )
+        if self._eventLoop and self._eventLoop.is_running():
+            asyncio.run_coroutine_threadsafe(
+                self._asyncDisconnect(),
+                self._eventLoop
+            )
         
-        if self._asyncThread and self._asyncThread.is_alive():
-            self._asyncThread.join(timeout=3.0)
+        # 接続処理（送信タスクの後始末を含む）の終了を待つ
+        if self._connectFuture:
+            try:
+                self._connectFuture.result(timeout=3.0)
+            except Exception:
+                pass
+            self._connectFuture = None
         
         self.connected = False
         self.state.connected = False
-        print("[WebRTCClient] 切断完了")
+        _logger.info("切断完了")
 
     async def _asyncDisconnect(self) -> None:
         """非同期切断処理"""
@@ -228,6 +547,10 @@ class WebRTCClient:
                 await self._conn.disconnect()
             except:
                 pass
+        
+        # 接続処理の待機を解除してループを終了させる
+        if self._stopEvent:
+            self._stopEvent.set()
 
     def setStateCallback(self, callback: Callable[[RobotState], None]) -> None:
         """状態更新コールバックを設定"""
@@ -249,24 +572,11 @@ class WebRTCClient:
             apiId: API ID (SportCmd)
             parameter: パラメータ辞書
         """
-        if not self.connected or not self._conn:
-            return
-        
-        try:
-            if self._eventLoop and self._eventLoop.is_running():
-                request = {"api_id": apiId}
-                if parameter:
-                    request["parameter"] = parameter
-                    
-                asyncio.run_coroutine_threadsafe(
-                    self._conn.datachannel.pub_sub.publish_request_new(
-                        RtcTopic.SPORT_MOD,
-                        request
-                    ),
-                    self._eventLoop
-                )
-        except Exception as e:
-            print(f"[WebRTCClient] コマンド送信エラー: {e}")
+        if parameter:
+            request = {"api_id": apiId, "parameter": parameter}
+        else:
+            request = _SPORT_REQUESTS.get(apiId) or {"api_id": apiId}
+        self._enqueueRequest(RtcTopic.SPORT_MOD, request)
 
     def _sendObstacleAvoidCommand(self, apiId: int, parameter: Optional[dict] = None) -> None:
         """
@@ -276,24 +586,10 @@ class WebRTCClient:
             apiId: API ID (ObstacleAvoidCmd)
             parameter: パラメータ辞書
         """
-        if not self.connected or not self._conn:
-            return
-        
-        try:
-            if self._eventLoop and self._eventLoop.is_running():
-                request = {"api_id": apiId}
-                if parameter:
-                    request["parameter"] = parameter
-                    
-                asyncio.run_coroutine_threadsafe(
-                    self._conn.datachannel.pub_sub.publish_request_new(
-                        RtcTopic.OBSTACLES_AVOID,
-                        request
-                    ),
-                    self._eventLoop
-                )
-        except Exception as e:
-            print(f"[WebRTCClient] 障害物回避コマンド送信エラー: {e}")
+        request = {"api_id": apiId}
+        if parameter:
+            request["parameter"] = parameter
+        self._enqueueRequest(RtcTopic.OBSTACLES_AVOID, request)
 
     # ============================================================
     # 基本制御コマンド
@@ -308,58 +604,53 @@ class WebRTCClient:
             vy: 左右速度 (m/s)
             vyaw: 旋回速度 (rad/s)
         """
-        if self.obstacleAvoidEnabled:
-            # 障害物回避付き移動
-            self._sendObstacleAvoidCommand(
-                ObstacleAvoidCmd.MOVE,
-                move_params(vx, vy, vyaw)
-            )
-        else:
-            # 通常移動
-            self._sendSportCommand(
-                SportCmd.MOVE,
-                move_params(vx, vy, vyaw)
-            )
+        if not self.connected or not self._conn:
+            return
         
-        self.state.velocity = [vx, vy, vyaw]
+        # 短時間に連続した呼び出しは合流させ、最新値だけを送信する
+        self._queueMove(vx, vy, vyaw)
+        self.state.velocity[:] = (vx, vy, vyaw)
 
     def standUp(self) -> None:
         """立ち上がりコマンドを送信"""
-        print("[WebRTCClient] コマンド: StandUp")
+        _debug("コマンド: StandUp")
         self._sendSportCommand(SportCmd.STAND_UP)
-        self.state.mode = RobotMode.STAND_UP
+        self.state.mode = int(RobotMode.STAND_UP)
 
     def standDown(self) -> None:
         """伏せるコマンドを送信"""
-        print("[WebRTCClient] コマンド: StandDown")
+        _debug("コマンド: StandDown")
         self._sendSportCommand(SportCmd.STAND_DOWN)
-        self.state.mode = RobotMode.STAND_DOWN
+        self.state.mode = int(RobotMode.STAND_DOWN)
 
     def balanceStand(self) -> None:
         """バランススタンドモードに移行"""
-        print("[WebRTCClient] コマンド: BalanceStand")
+        _debug("コマンド: BalanceStand")
         self._sendSportCommand(SportCmd.BALANCE_STAND)
 
     def recoveryStand(self) -> None:
         """リカバリースタンド（転倒復帰）"""
-        print("[WebRTCClient] コマンド: RecoveryStand")
+        _debug("コマンド: RecoveryStand")
         self._sendSportCommand(SportCmd.RECOVERY_STAND)
 
     def stopMove(self) -> None:
         """移動を停止"""
-        print("[WebRTCClient] コマンド: StopMove")
+        _debug("コマンド: StopMove")
         self._sendSportCommand(SportCmd.STOP_MOVE)
-        self.state.velocity = [0, 0, 0]
+        # 未送信の移動コマンドが停止後に送られないよう速度0で上書き
+        if self.connected:
+            self._queueMove(0.0, 0.0, 0.0)
+        self.state.velocity[:] = 0.0
 
     def damp(self) -> None:
         """ダンプモード（脱力）"""
-        print("[WebRTCClient] コマンド: Damp")
+        _debug("コマンド: Damp")
         self._sendSportCommand(SportCmd.DAMP)
-        self.state.mode = RobotMode.IDLE
+        self.state.mode = int(RobotMode.IDLE)
 
     def emergencyStop(self) -> None:
         """緊急停止"""
-        print("[WebRTCClient] ⚠️ 緊急停止!")
+        _logger.warning("⚠️ 緊急停止!")
         self.stopMove()
         self.damp()
 
@@ -374,7 +665,7 @@ class WebRTCClient:
         Args:
             enable: True=ON, False=OFF
         """
-        print(f"[WebRTCClient] 障害物回避: {'ON' if enable else 'OFF'}")
+        _logger.info("障害物回避: %s", "ON" if enable else "OFF")
         self._sendObstacleAvoidCommand(
             ObstacleAvoidCmd.SWITCH,
             obstacle_avoid_params(enable)
@@ -395,7 +686,7 @@ class WebRTCClient:
 
     def pose(self) -> None:
         """ポーズモード開始（Euler前に必要）"""
-        print("[WebRTCClient] コマンド: Pose")
+        _debug("コマンド: Pose")
         self._sendSportCommand(SportCmd.POSE)
 
     def euler(self, roll: float, pitch: float, yaw: float) -> None:
@@ -409,7 +700,7 @@ class WebRTCClient:
             pitch: ピッチ角 (rad)
             yaw: ヨー角 (rad)
         """
-        print(f"[WebRTCClient] コマンド: Euler (r:{roll:.2f}, p:{pitch:.2f}, y:{yaw:.2f})")
+        _debug("コマンド: Euler (r:%.2f, p:%.2f, y:%.2f)", roll, pitch, yaw)
         self._sendSportCommand(
             SportCmd.EULER,
             euler_params(roll, pitch, yaw)
@@ -422,7 +713,7 @@ class WebRTCClient:
         Args:
             height: 体高 (m)
         """
-        print(f"[WebRTCClient] コマンド: BodyHeight ({height:.2f}m)")
+        _debug("コマンド: BodyHeight (%.2fm)", height)
         self._sendSportCommand(SportCmd.BODY_HEIGHT, {"height": height})
 
     # ============================================================
@@ -436,7 +727,7 @@ class WebRTCClient:
         Args:
             gaitType: 歩行タイプ (GaitType)
         """
-        print(f"[WebRTCClient] コマンド: SwitchGait ({gaitType})")
+        _debug("コマンド: SwitchGait (%s)", gaitType)
         self._sendSportCommand(SportCmd.SWITCH_GAIT, {"gait": gaitType})
 
     def setSpeedLevel(self, level: int) -> None:
@@ -446,7 +737,7 @@ class WebRTCClient:
         Args:
             level: 速度レベル (SpeedLevel)
         """
-        print(f"[WebRTCClient] コマンド: SpeedLevel ({level})")
+        _debug("コマンド: SpeedLevel (%s)", level)
         self._sendSportCommand(SportCmd.SPEED_LEVEL, {"level": level})
 
     # ============================================================
@@ -456,8 +747,8 @@ class WebRTCClient:
 
     def _doSpecialAction(self, apiId: int, actionName: str) -> None:
         """特殊動作を実行（内部用）"""
-        print(f"[WebRTCClient] 🎭 特殊動作: {actionName}")
-        self._sendSportCommand(apiId, special_action_params())
+        _logger.info("🎭 特殊動作: %s", actionName)
+        self._enqueueRequest(RtcTopic.SPORT_MOD, _SPECIAL_REQUESTS[apiId])
 
     def backFlip(self) -> None:
         """バック宙返り 🔥"""
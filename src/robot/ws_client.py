@@ -14,14 +14,105 @@ Jetson上のブリッジサーバーとWebSocket経由で通信するクライ
 """
 
 import asyncio
+import concurrent.futures
+import functools
 import json
+import logging
+import math
+import struct
 import threading
 import time
-from typing import Optional, Callable, Any
-from dataclasses import dataclass
-import queue
+from typing import Optional, Callable, Any, Tuple, Union
+from dataclasses import dataclass, replace
 
-from .state import RobotState, IMUState, FootState, RobotMode
+import numpy as np
+
+from .state import RobotState, IMUState, FootArray, RobotMode
+from .io_loop import getIoLoop
+
+# アプリのロガー配下に置き、ハンドラ・レベル設定を共有する
+_logger = logging.getLogger("unitree_go2.websocket")
+# 頻繁に呼ばれる経路用に束縛しておく（DEBUG無効時はレベル判定のみで戻る）
+_debug = _logger.debug
+
+# orjson（オプション: 高速JSONエンコード、出力はbytes）
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# MessagePack（オプション: バイナリ状態受信）
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+
+def _jsonDefault(obj: Any) -> Any:
+    """標準jsonで扱えないNumPyの配列・スカラーを変換"""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"JSONに変換できない型: {type(obj).__name__}")
+
+
+def _jsonDumps(obj: Any) -> bytes:
+    """
+    JSONをbytesにエンコード（orjsonがあれば使用）
+
+    NumPyの配列・スカラーはorjsonではバッファから直接エンコードする
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=_jsonDefault).encode()
+
+
+# パラメータなしコマンド（インポート時に一度だけJSONへエンコード）
+_CMD_STAND_UP = _jsonDumps({"type": "standUp"})
+_CMD_STAND_DOWN = _jsonDumps({"type": "standDown"})
+_CMD_BALANCE_STAND = _jsonDumps({"type": "balanceStand"})
+_CMD_RECOVERY_STAND = _jsonDumps({"type": "recoveryStand"})
+_CMD_STOP_MOVE = _jsonDumps({"type": "stopMove"})
+_CMD_DAMP = _jsonDumps({"type": "damp"})
+_CMD_EMERGENCY_STOP = _jsonDumps({"type": "emergencyStop"})
+_CMD_SET_FORMAT_MSGPACK = _jsonDumps({"type": "setFormat", "format": "msgpack"})
+
+@functools.lru_cache(maxsize=64)
+def _encodeMove(vx: float, vy: float, vyaw: float) -> bytes:
+    """
+    移動コマンドをエンコード
+
+    停止中の0指令や一定速度での走行など、同じ速度の繰り返しはキャッシュを返す
+
+    Args:
+        vx: 前後速度 (m/s)
+        vy: 左右速度 (m/s)
+        vyaw: 旋回速度 (rad/s)
+
+    Returns:
+        bytes: JSONエンコード済みコマンド
+    """
+    return _jsonDumps({"type": "move", "vx": vx, "vy": vy, "vyaw": vyaw})
+
+
+# 送信キュー上で「最新の移動コマンドを送る」ことを表す目印
+_MOVE_MARKER = object()
+
+# 度 → ラジアン
+_DEG2RAD = math.pi / 180.0
+
+# 状態メッセージの姿勢角キー（度）
+_IMU_KEYS = ("imuRoll", "imuPitch", "imuYaw")
+
+# ブリッジのモード名 → RobotModeの値
+_MODE_BY_NAME = {
+    "IDLE": int(RobotMode.IDLE),
+    "DOWN": int(RobotMode.STAND_DOWN),
+    "STAND": int(RobotMode.STAND_UP),
+    "WALK": int(RobotMode.WALKING),
+    "RUN": int(RobotMode.RUNNING),
+}
 
 
 class WebSocketClient:
@@ -37,6 +128,15 @@ class WebSocketClient:
     """
 
     DEFAULT_PORT = 8765
+    
+    # 再接続までの待ち時間（秒）
+    RECONNECT_DELAY = 3.0
+    
+    # 未処理の受信メッセージの上限（超えたら古いものから捨てる）
+    MAX_PENDING_MESSAGES = 4
+    
+    # 移動コマンドの最小送信間隔（秒）
+    MOVE_INTERVAL = 0.02
 
     def __init__(self, jetsonIp: str = "192.168.123.18", port: int = DEFAULT_PORT):
         """
@@ -59,8 +159,9 @@ class WebSocketClient:
         
         # スレッド制御
         self._running = False
-        self._connectThread: Optional[threading.Thread] = None
-        self._receiveThread: Optional[threading.Thread] = None
+        self._connectFuture: Optional[concurrent.futures.Future] = None
+        # 接続確立の通知（connect()の待機用）
+        self._connectedEvent = threading.Event()
         
         # コールバック
         self._stateCallback: Optional[Callable[[RobotState], None]] = None
@@ -69,8 +170,17 @@ class WebSocketClient:
         # 状態
         self.state = RobotState()
         
-        # コマンドキュー
-        self._commandQueue: queue.Queue = queue.Queue()
+        # イベントループ（接続維持ループの実行中のみ設定）
+        self._eventLoop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopEvent: Optional[asyncio.Event] = None
+        
+        # コマンドキュー（接続ごとに作成し、put_nowaitはイベントループ上で実行）
+        self._commandQueue: Optional[asyncio.Queue] = None
+        
+        # 移動コマンドの合流（キューには目印を1つだけ置き、送信時に最新値を読む）
+        self._pendingMove: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+        self._moveQueued = False
+        self._lastMoveSent = 0.0
 
     def connect(self) -> bool:
         """
@@ -79,33 +189,45 @@ class WebSocketClient:
         Returns:
             bool: 接続成功時True
         """
-        print(f"[WebSocketClient] 接続中: {self.wsUrl}")
+        _logger.info("接続中: %s", self.wsUrl)
         
         self._running = True
+        self._connectedEvent.clear()
         
-        # 接続スレッド開始
-        self._connectThread = threading.Thread(target=self._connectionLoop, daemon=True)
-        self._connectThread.start()
+        # 共有の通信用イベントループ上で接続維持ループを開始
+        self._connectFuture = asyncio.run_coroutine_threadsafe(
+            self._reconnectLoop(), getIoLoop()
+        )
         
         # 接続待ち（最大5秒）
-        for _ in range(50):
-            if self.connected:
-                return True
-            time.sleep(0.1)
-        
-        return self.connected
+        return self._connectedEvent.wait(timeout=5.0)
 
     def disconnect(self) -> None:
         """接続を切断"""
-        print("[WebSocketClient] 切断中...")
+        _logger.info("切断中...")
         self._running = False
         
-        if self._connectThread and self._connectThread.is_alive():
-            self._connectThread.join(timeout=2.0)
+        # コマンド待ちの送信ループと再接続待ちを起こして終了させる
+        self._enqueue(None)
+        loop = self._eventLoop
+        if loop and self._stopEvent:
+            try:
+                loop.call_soon_threadsafe(self._stopEvent.set)
+            except RuntimeError:
+                # イベントループ終了済み
+                pass
+        
+        if self._connectFuture:
+            try:
+                self._connectFuture.result(timeout=2.0)
+            except Exception:
+                pass
+            self._connectFuture = None
         
         self.connected = False
-        self.state.connected = False
-        print("[WebSocketClient] 切断完了")
+        self.state = replace(self.state, connected=False)
+        self._connectedEvent.clear()
+        _logger.info("切断完了")
 
     def setStateCallback(self, callback: Callable[[RobotState], None]) -> None:
         """
@@ -125,47 +247,68 @@ class WebSocketClient:
         """
         self._connectionCallback = callback
 
-    def _connectionLoop(self) -> None:
-        """接続維持ループ"""
-        import asyncio
+    async def _reconnectLoop(self) -> None:
+        """接続維持ループ（切断されたら同じイベントループ上で再接続）"""
+        self._eventLoop = asyncio.get_running_loop()
+        self._stopEvent = asyncio.Event()
         
-        while self._running:
-            try:
-                asyncio.run(self._asyncConnectionLoop())
-            except Exception as e:
-                print(f"[WebSocketClient] 接続エラー: {e}")
+        try:
+            while self._running:
+                try:
+                    await self._asyncConnectionLoop()
+                except Exception as e:
+                    _logger.error("接続エラー: %s", e)
+                
                 self.connected = False
-                self.state.connected = False
+                self.state = replace(self.state, connected=False)
+                if not self._running:
+                    break
                 if self._connectionCallback:
                     self._connectionCallback(False)
-            
-            if self._running:
-                print("[WebSocketClient] 3秒後に再接続...")
-                time.sleep(3)
+                
+                _logger.info("%g秒後に再接続...", self.RECONNECT_DELAY)
+                try:
+                    await asyncio.wait_for(self._stopEvent.wait(), timeout=self.RECONNECT_DELAY)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._eventLoop = None
 
     async def _asyncConnectionLoop(self) -> None:
         """非同期接続ループ"""
         try:
             import websockets
         except ImportError:
-            print("[WebSocketClient] websocketsがインストールされていません")
-            print("  pip install websockets")
+            _logger.error("websocketsがインストールされていません (pip install websockets)")
             return
         
-        async with websockets.connect(self.wsUrl) as ws:
-            print(f"[WebSocketClient] 接続成功: {self.wsUrl}")
+        # 死活監視はライブラリのPing/Pongに任せる
+        # 小さなフレームばかりなので圧縮(permessage-deflate)は無効にする（ブリッジ側も無効）
+        async with websockets.connect(
+            self.wsUrl,
+            compression=None,
+            ping_interval=20,
+            ping_timeout=10,
+            max_size=2**20,
+        ) as ws:
+            _logger.info("接続成功: %s", self.wsUrl)
             self._ws = ws
+            self._commandQueue = asyncio.Queue()
+            self._moveQueued = False
             self.connected = True
-            self.state.connected = True
+            self.state = replace(self.state, connected=True)
+            self._connectedEvent.set()
             
             if self._connectionCallback:
                 self._connectionCallback(True)
             
-            # 送受信タスクを並行実行
-            receiveTask = asyncio.create_task(self._receiveLoop(ws))
+            # 送受信タスクを並行実行（受信メッセージの処理は別タスク）
+            messageQueue: asyncio.Queue = asyncio.Queue(maxsize=self.MAX_PENDING_MESSAGES)
+            receiveTask = asyncio.create_task(self._receiveLoop(ws, messageQueue))
             sendTask = asyncio.create_task(self._sendLoop(ws))
+            processTask = asyncio.create_task(self._processLoop(messageQueue))
             
-            # どちらかが終了するまで待機
+            # 送受信のどちらかが終了するまで待機
             done, pending = await asyncio.wait(
                 [receiveTask, sendTask],
                 return_when=asyncio.FIRST_COMPLETED
@@ -174,46 +317,128 @@ class WebSocketClient:
             # 残りのタスクをキャンセル
             for task in pending:
                 task.cancel()
+            processTask.cancel()
+            
+            # 以降のコマンドは破棄（再接続時に古いコマンドを送らない）
+            self._commandQueue = None
+
+    async def _receiveLoop(self, ws, messageQueue: asyncio.Queue) -> None:
+        """
+        メッセージ受信ループ
 
-    async def _receiveLoop(self, ws) -> None:
-        """メッセージ受信ループ"""
+        受信したメッセージは処理タスクに渡すだけにし、処理が遅れても受信を止めない。
+        キューが満杯なら最も古いメッセージを捨てる（状態は最新のものがあればよい）
+
+        Args:
+            ws: WebSocket接続
+            messageQueue: 処理待ちメッセージのキュー
+        """
         try:
             async for message in ws:
-                self._handleMessage(message)
+                if messageQueue.full():
+                    messageQueue.get_nowait()
+                messageQueue.put_nowait(message)
         except Exception as e:
-            print(f"[WebSocketClient] 受信エラー: {e}")
+            _logger.error("受信エラー: %s", e)
+
+    async def _processLoop(self, messageQueue: asyncio.Queue) -> None:
+        """
+        受信メッセージ処理ループ
+
+        Args:
+            messageQueue: 処理待ちメッセージのキュー
+        """
+        while True:
+            self._handleMessage(await messageQueue.get())
 
     async def _sendLoop(self, ws) -> None:
-        """コマンド送信ループ"""
+        """
+        コマンド送信ループ
+
+        最初の1件を待ち、その時点でキューに溜まっている残りをまとめて送信する。
+        Noneを受け取ったら終了する
+        """
+        loop = asyncio.get_running_loop()
+        commandQueue = self._commandQueue
         while self._running and self.connected:
             try:
-                # キューからコマンドを取得（タイムアウト付き）
-                try:
-                    cmd = self._commandQueue.get(timeout=0.1)
-                    await ws.send(json.dumps(cmd))
-                except queue.Empty:
-                    pass
+                batch = [await commandQueue.get()]
+                
+                # 溜まっている分を一括で取り出す
+                while not commandQueue.empty():
+                    batch.append(commandQueue.get_nowait())
                 
-                await asyncio.sleep(0.01)
+                for payload in batch:
+                    if payload is None:
+                        return
+                    if payload is _MOVE_MARKER:
+                        # 送信間隔に満たない場合は目印を残りの時間だけ遅らせて再投入
+                        wait = self._lastMoveSent + self.MOVE_INTERVAL - loop.time()
+                        if wait > 0:
+                            loop.call_later(wait, commandQueue.put_nowait, _MOVE_MARKER)
+                            continue
+                        # 目印を下ろしてから読む（以降のmove()は新しい目印を置く）
+                        self._moveQueued = False
+                        payload = _encodeMove(*self._pendingMove)
+                        self._lastMoveSent = loop.time()
+                    await ws.send(payload)
                 
             except Exception as e:
-                print(f"[WebSocketClient] 送信エラー: {e}")
+                _logger.error("送信エラー: %s", e)
                 break
 
-    def _handleMessage(self, message: str) -> None:
+    @staticmethod
+    def _decodeMessage(message: Union[str, bytes]) -> dict:
+        """
+        受信メッセージをデコード
+
+        ブリッジはJSON（テキスト/バイナリ）とmsgpackのフレームを送ってくる。
+        先頭バイトで判別する:
+        - '{' : JSON
+        - 0x00: 4バイト長プレフィクス付きmsgpackフレームの連結（最新の1つだけ使う）
+        - その他: msgpackフレーム単体
+
+        Args:
+            message: 受信メッセージ
+
+        Returns:
+            dict: デコード結果
+        """
+        if isinstance(message, str) or message[:1] == b"{":
+            return json.loads(message)
+        
+        if message[:1] == b"\x00":
+            # バッチ: 最後のフレームまで長さを辿る
+            view = memoryview(message)
+            offset = 0
+            while True:
+                (length,) = struct.unpack_from(">I", view, offset)
+                start = offset + 4
+                offset = start + length
+                if offset >= len(view):
+                    break
+            return msgpack.unpackb(view[start:offset])
+        
+        return msgpack.unpackb(message)
+
+    def _handleMessage(self, message: Union[str, bytes]) -> None:
         """
         受信メッセージを処理
 
         Args:
-            message: 受信したJSONメッセージ
+            message: 受信したメッセージ（JSONまたはmsgpack）
         """
         try:
-            data = json.loads(message)
+            data = self._decodeMessage(message)
             msgType = data.get("type", "")
             
             if msgType == "connected":
                 self.simulationMode = data.get("simulationMode", False)
-                print(f"[WebSocketClient] ブリッジ接続確認 (シミュレーション: {self.simulationMode})")
+                _logger.info("ブリッジ接続確認 (シミュレーション: %s)", self.simulationMode)
+                
+                # ブリッジが対応していれば状態配信をmsgpackに切り替える
+                if MSGPACK_AVAILABLE and "msgpack" in data.get("formats", ()):
+                    self._sendPayload(_CMD_SET_FORMAT_MSGPACK)
                 
             elif msgType == "state":
                 self._updateState(data.get("data", {}))
@@ -222,72 +447,93 @@ class WebSocketClient:
                 pass  # Ping応答
                 
         except json.JSONDecodeError:
-            print(f"[WebSocketClient] 無効なJSON: {message[:100]}")
+            _debug("無効なJSON: %.100s", message)
         except Exception as e:
-            print(f"[WebSocketClient] メッセージ処理エラー: {e}")
+            _debug("メッセージ処理エラー: %s", e)
 
     def _updateState(self, data: dict) -> None:
         """
         状態を更新
 
+        ブリッジの状態メッセージは毎回全項目を含むため、受信ごとに新しい
+        RobotStateを組み立てて差し替える。公開後のオブジェクトは書き換えないので、
+        コールバックにはコピーせずそのまま渡す
+
         Args:
             data: 状態データ辞書
         """
-        self.state.timestamp = data.get("timestamp", time.time())
-        self.state.connected = True
-        
-        # モード
-        modeStr = data.get("mode", "UNKNOWN")
-        modeMap = {
-            "IDLE": RobotMode.IDLE,
-            "DOWN": RobotMode.STAND_DOWN,
-            "STAND": RobotMode.STAND_UP,
-            "WALK": RobotMode.WALKING,
-            "RUN": RobotMode.RUNNING,
-        }
-        self.state.mode = modeMap.get(modeStr, RobotMode.UNKNOWN)
-        
-        # バッテリー
-        self.state.batteryLevel = data.get("batteryLevel", 0)
-        self.state.batteryVoltage = data.get("batteryVoltage", 0.0)
-        self.state.batteryCurrent = data.get("batteryCurrent", 0.0)
-        self.state.batteryTemperature = data.get("batteryTemperature", 25.0)
-        
         # IMU
-        self.state.imu.rpy = [
-            data.get("imuRoll", 0.0) * 0.0174533,  # deg to rad
-            data.get("imuPitch", 0.0) * 0.0174533,
-            data.get("imuYaw", 0.0) * 0.0174533,
-        ]
-        self.state.imu.gyroscope = data.get("imuGyro", [0, 0, 0])
-        self.state.imu.accelerometer = data.get("imuAccel", [0, 0, 9.81])
+        imu = IMUState(
+            gyroscope=np.array(data.get("imuGyro", (0, 0, 0)), dtype=np.float64),
+            accelerometer=np.array(data.get("imuAccel", (0, 0, 9.81)), dtype=np.float64),
+        )
+        imu.setRpy(*[data.get(key, 0.0) * _DEG2RAD for key in _IMU_KEYS])
         
-        # 速度
-        self.state.velocity = [
-            data.get("velocityX", 0.0),
-            data.get("velocityY", 0.0),
-            data.get("velocityYaw", 0.0),
-        ]
+        # 足状態（通常は4要素。欠けている足は初期値のまま）
+        feet = FootArray()
+        footContacts = data.get("footContacts", ())[:len(feet)]
+        footForces = data.get("footForces", ())[:len(feet)]
+        feet.contact[:len(footContacts)] = footContacts
+        feet.force[:len(footForces)] = footForces
         
-        # 足状態
-        footContacts = data.get("footContacts", [False, False, False, False])
-        footForces = data.get("footForces", [0, 0, 0, 0])
-        for i in range(4):
-            self.state.feet[i].contact = footContacts[i] if i < len(footContacts) else False
-            self.state.feet[i].force = footForces[i] if i < len(footForces) else 0
+        state = RobotState(
+            timestamp=data.get("timestamp") or time.time(),
+            connected=True,
+            mode=_MODE_BY_NAME.get(data.get("mode"), -1),
+            batteryLevel=data.get("batteryLevel", 0),
+            batteryVoltage=data.get("batteryVoltage", 0.0),
+            batteryCurrent=data.get("batteryCurrent", 0.0),
+            batteryTemperature=data.get("batteryTemperature", 25.0),
+            imu=imu,
+            feet=feet,
+            velocity=np.array((
+                data.get("velocityX", 0.0),
+                data.get("velocityY", 0.0),
+                data.get("velocityYaw", 0.0),
+            ), dtype=np.float64),
+        )
+        self.state = state
         
         # コールバック呼び出し
         if self._stateCallback:
-            self._stateCallback(self.state.copy())
+            self._stateCallback(state)
 
     def _sendCommand(self, cmd: dict) -> None:
         """
-        コマンドを送信キューに追加
+        コマンドをエンコードして送信キューに追加
 
         Args:
             cmd: コマンド辞書
         """
-        self._commandQueue.put(cmd)
+        self._sendPayload(_jsonDumps(cmd))
+
+    def _sendPayload(self, payload: bytes) -> None:
+        """
+        エンコード済みコマンドを送信キューに追加
+
+        Args:
+            payload: JSONエンコード済みコマンド
+        """
+        self._enqueue(payload)
+
+    def _enqueue(self, item: Any) -> None:
+        """
+        送信キューに追加（任意のスレッドから呼び出し可）
+
+        未接続時は破棄する
+
+        Args:
+            item: 送信データ（Noneは送信ループの終了要求、_MOVE_MARKERは移動コマンド）
+        """
+        loop = self._eventLoop
+        commandQueue = self._commandQueue
+        if loop is None or commandQueue is None:
+            return
+        try:
+            loop.call_soon_threadsafe(commandQueue.put_nowait, item)
+        except RuntimeError:
+            # イベントループ終了済み
+            pass
 
     # ============================================================
     # 制御コマンド
@@ -302,38 +548,40 @@ class WebSocketClient:
             vy: 左右速度 (m/s)
             vyaw: 旋回速度 (rad/s)
         """
-        self._sendCommand({
-            "type": "move",
-            "vx": vx,
-            "vy": vy,
-            "vyaw": vyaw
-        })
+        # 送信前に届いた移動コマンドは最新値で上書きし、1回だけ送信する
+        self._pendingMove = (vx, vy, vyaw)
+        if not self._moveQueued:
+            self._moveQueued = True
+            self._enqueue(_MOVE_MARKER)
 
     def standUp(self) -> None:
         """立ち上がりコマンドを送信"""
-        self._sendCommand({"type": "standUp"})
+        self._sendPayload(_CMD_STAND_UP)
 
     def standDown(self) -> None:
         """伏せるコマンドを送信"""
-        self._sendCommand({"type": "standDown"})
+        self._sendPayload(_CMD_STAND_DOWN)
 
     def balanceStand(self) -> None:
         """バランススタンドモードに移行"""
-        self._sendCommand({"type": "balanceStand"})
+        self._sendPayload(_CMD_BALANCE_STAND)
 
     def recoveryStand(self) -> None:
         """リカバリースタンド（転倒復帰）"""
-        self._sendCommand({"type": "recoveryStand"})
+        self._sendPayload(_CMD_RECOVERY_STAND)
 
     def stopMove(self) -> None:
         """移動を停止"""
-        self._sendCommand({"type": "stopMove"})
+        self._sendPayload(_CMD_STOP_MOVE)
+        # 未送信の移動コマンドが停止後に送られないよう速度0で上書き
+        self._pendingMove = (0.0, 0.0, 0.0)
 
     def damp(self) -> None:
         """ダンプモード（脱力）"""
-        self._sendCommand({"type": "damp"})
+        self._sendPayload(_CMD_DAMP)
 
     def emergencyStop(self) -> None:
         """緊急停止"""
-        self._sendCommand({"type": "emergencyStop"})
+        self._sendPayload(_CMD_EMERGENCY_STOP)
+        self._pendingMove = (0.0, 0.0, 0.0)
 
@@ -11,11 +11,14 @@ Unitree Go2 Controller - Mission Impossible Edition
 """
 
 import time
+from datetime import date, datetime
+from typing import Optional
+
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QFrame, QSplitter, QStatusBar, QMessageBox
 )
-from PySide6.QtCore import Qt, QTimer, Slot
+from PySide6.QtCore import Qt, QEvent, QTimer, Slot
 from PySide6.QtGui import QFont, QKeySequence, QShortcut, QAction
 
 from .widgets import (
@@ -25,6 +28,9 @@ from .widgets import (
 )
 from .styles import loadStylesheet
 
+# 時計タイマーを秒の切り替わりから遅らせる量（ミリ秒）
+CLOCK_MARGIN_MS = 5
+
 
 class MainWindow(QMainWindow):
     """
@@ -45,6 +51,11 @@ class MainWindow(QMainWindow):
         stylesheet = loadStylesheet("mission")
         self.setStyleSheet(stylesheet)
         
+        # 最後に表示した日付（日付ラベルは日が変わった時だけ更新）
+        self._lastDate: Optional[date] = None
+        # 最後に表示した時刻（同じ秒に再描画しない）
+        self._lastClockText = ""
+
         self._setupUi()
         self._setupShortcuts()
         self._setupStatusBar()
@@ -57,21 +68,17 @@ class MainWindow(QMainWindow):
         centralWidget.setObjectName("centralWidget")
         self.setCentralWidget(centralWidget)
 
-        # メインレイアウト
-        mainLayout = QHBoxLayout(centralWidget)
+        # メインレイアウト（全パネルを1つのグリッドに配置）
+        # 列: 0=左パネル, 1-2=中央（カメラ・バッテリー/速度）, 3=センサー, 4=特殊動作
+        # 行: 0=時刻ヘッダー, 1-4=カメラ, 5-6=バッテリー/速度（センサーは3段に分割）
+        mainLayout = QGridLayout(centralWidget)
         mainLayout.setContentsMargins(12, 12, 12, 12)
         mainLayout.setSpacing(12)
+        self._mainLayout = mainLayout
 
         # === 左パネル（ステータス・コントロール） ===
         leftPanel = QFrame()
         leftPanel.setObjectName("tacticalPanel")
-        leftPanel.setStyleSheet("""
-            QFrame#tacticalPanel {
-                background-color: #0A0A0A;
-                border: 1px solid #1A1A1A;
-                border-top: 2px solid #DC143C;
-            }
-        """)
         leftPanel.setFixedWidth(340)
         leftLayout = QVBoxLayout(leftPanel)
         leftLayout.setContentsMargins(0, 0, 0, 0)
@@ -79,40 +86,26 @@ class MainWindow(QMainWindow):
 
         # ヘッダー - IMF Tactical Style
         headerContainer = QWidget()
-        headerContainer.setStyleSheet("background-color: #050505;")
+        headerContainer.setObjectName("headerContainer")
         headerLayout = QVBoxLayout(headerContainer)
         headerLayout.setContentsMargins(16, 16, 16, 12)
         headerLayout.setSpacing(4)
         
         # クラシファイドマーカー
         classifiedLabel = QLabel("◆◆◆ CLASSIFIED ◆◆◆")
-        classifiedLabel.setStyleSheet("""
-            color: #DC143C;
-            font-size: 9px;
-            font-weight: bold;
-            letter-spacing: 4px;
-        """)
+        classifiedLabel.setObjectName("classifiedLabel")
         classifiedLabel.setAlignment(Qt.AlignCenter)
         headerLayout.addWidget(classifiedLabel)
         
         # メインタイトル
         titleLabel = QLabel("UNITREE GO2")
-        titleLabel.setStyleSheet("""
-            color: #FFFFFF;
-            font-size: 22px;
-            font-weight: bold;
-            letter-spacing: 8px;
-        """)
+        titleLabel.setObjectName("titleLabel")
         titleLabel.setAlignment(Qt.AlignCenter)
         headerLayout.addWidget(titleLabel)
 
         # サブタイトル
         subtitleLabel = QLabel("TACTICAL CONTROL SYSTEM v1.0")
-        subtitleLabel.setStyleSheet("""
-            color: #404040;
-            font-size: 9px;
-            letter-spacing: 3px;
-        """)
+        subtitleLabel.setObjectName("subtitleLabel")
         subtitleLabel.setAlignment(Qt.AlignCenter)
         headerLayout.addWidget(subtitleLabel)
 
@@ -121,242 +114,173 @@ class MainWindow(QMainWindow):
         # セパレーター
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
-        separator.setStyleSheet("background-color: #DC143C; min-height: 2px; max-height: 2px;")
+        separator.setObjectName("separatorRed")
         leftLayout.addWidget(separator)
 
         # ステータスウィジェット
         self.statusWidget = StatusWidget()
         leftLayout.addWidget(self.statusWidget, 1)
 
-        mainLayout.addWidget(leftPanel)
-
-        # === 中央パネル（カメラ + 情報） ===
-        centerPanel = QWidget()
-        centerLayout = QVBoxLayout(centerPanel)
-        centerLayout.setContentsMargins(0, 0, 0, 0)
-        centerLayout.setSpacing(12)
+        mainLayout.addWidget(leftPanel, 0, 0, 7, 1)
 
+        # === 中央（カメラ + 情報） ===
         # ヘッダー（時刻表示）- 作戦時刻風
         headerLayout = QHBoxLayout()
         headerLayout.setSpacing(16)
         
         # ライブフィードインジケーター
         liveIndicator = QLabel("● LIVE")
-        liveIndicator.setStyleSheet("""
-            color: #DC143C;
-            font-size: 10px;
-            font-weight: bold;
-            letter-spacing: 2px;
-        """)
+        liveIndicator.setObjectName("liveIndicator")
         headerLayout.addWidget(liveIndicator)
         
         # 時刻表示
         self.clockLabel = QLabel("00:00:00")
-        self.clockLabel.setStyleSheet("""
-            color: #FFFFFF;
-            font-size: 18px;
-            font-weight: bold;
-            letter-spacing: 2px;
-        """)
+        self.clockLabel.setObjectName("clockLabel")
         headerLayout.addWidget(self.clockLabel)
         
         headerLayout.addStretch()
 
         # 日付表示
         self.dateLabel = QLabel("2025-01-01")
-        self.dateLabel.setStyleSheet("""
-            color: #404040;
-            font-size: 11px;
-            letter-spacing: 2px;
-        """)
+        self.dateLabel.setObjectName("dateLabel")
         headerLayout.addWidget(self.dateLabel)
         
         # ミッションステータス
         missionLabel = QLabel("◆ MISSION ACTIVE")
-        missionLabel.setStyleSheet("""
-            color: #00E676;
-            font-size: 10px;
-            font-weight: bold;
-            letter-spacing: 2px;
-        """)
+        missionLabel.setObjectName("missionLabel")
         headerLayout.addWidget(missionLabel)
 
-        centerLayout.addLayout(headerLayout)
+        mainLayout.addLayout(headerLayout, 0, 1, 1, 2)
 
         # カメラウィジェット - 諜報映像風
-        self.cameraWidget = CameraWidget()
-        self.cameraWidget.setStyleSheet("""
-            QWidget#cameraWidget {
-                background-color: #050505;
-                border: 1px solid #DC143C;
-            }
-        """)
-        centerLayout.addWidget(self.cameraWidget, 2)
-
-        # 下部情報パネル
-        bottomInfoLayout = QHBoxLayout()
-        bottomInfoLayout.setSpacing(12)
+        # 最初の映像フレームが届くまでは軽量なプレースホルダーを置く
+        self.cameraWidget: Optional[CameraWidget] = None
+        self._cameraPlaceholder = QLabel("NO SIGNAL")
+        self._cameraPlaceholder.setObjectName("cameraPlaceholder")
+        self._cameraPlaceholder.setAlignment(Qt.AlignCenter)
+        mainLayout.addWidget(self._cameraPlaceholder, 1, 1, 4, 2)
 
         # バッテリーウィジェット
-        batteryFrame = QFrame()
-        batteryFrame.setStyleSheet("""
-            QFrame {
-                background-color: #0A0A0A;
-                border: 1px solid #1A1A1A;
-                border-left: 2px solid #DC143C;
-            }
-        """)
-        batteryFrameLayout = QVBoxLayout(batteryFrame)
-        batteryFrameLayout.setContentsMargins(0, 0, 0, 0)
         self.batteryWidget = BatteryWidget()
-        batteryFrameLayout.addWidget(self.batteryWidget)
-        bottomInfoLayout.addWidget(batteryFrame, 1)
+        mainLayout.addWidget(self._wrapInPanel(self.batteryWidget, "batteryFrame"), 5, 1, 2, 1)
 
         # 速度ウィジェット
-        speedFrame = QFrame()
-        speedFrame.setStyleSheet("""
-            QFrame {
-                background-color: #0A0A0A;
-                border: 1px solid #1A1A1A;
-                border-left: 2px solid #DC143C;
-            }
-        """)
-        speedFrameLayout = QVBoxLayout(speedFrame)
-        speedFrameLayout.setContentsMargins(0, 0, 0, 0)
         self.speedWidget = SpeedWidget()
-        speedFrameLayout.addWidget(self.speedWidget)
-        bottomInfoLayout.addWidget(speedFrame, 1)
-
-        centerLayout.addLayout(bottomInfoLayout, 1)
-
-        mainLayout.addWidget(centerPanel, 1)
-
-        # === 右パネル（センサー情報） ===
-        rightPanel = QWidget()
-        rightLayout = QVBoxLayout(rightPanel)
-        rightLayout.setContentsMargins(0, 0, 0, 0)
-        rightLayout.setSpacing(12)
+        mainLayout.addWidget(self._wrapInPanel(self.speedWidget, "speedFrame"), 5, 2, 2, 1)
 
+        # === 右列（センサー情報） ===
         # IMUウィジェット
-        imuFrame = QFrame()
-        imuFrame.setStyleSheet("""
-            QFrame {
-                background-color: #0A0A0A;
-                border: 1px solid #1A1A1A;
-                border-top: 2px solid #DC143C;
-            }
-        """)
-        imuFrameLayout = QVBoxLayout(imuFrame)
-        imuFrameLayout.setContentsMargins(0, 0, 0, 0)
         self.imuWidget = IMUWidget()
-        imuFrameLayout.addWidget(self.imuWidget)
-        rightLayout.addWidget(imuFrame, 1)
+        mainLayout.addWidget(self._wrapInPanel(self.imuWidget, "imuFrame"), 0, 3, 3, 1)
 
         # ロボットビューウィジェット
-        robotFrame = QFrame()
-        robotFrame.setStyleSheet("""
-            QFrame {
-                background-color: #0A0A0A;
-                border: 1px solid #1A1A1A;
-                border-top: 2px solid #DC143C;
-            }
-        """)
-        robotFrameLayout = QVBoxLayout(robotFrame)
-        robotFrameLayout.setContentsMargins(0, 0, 0, 0)
         self.robotViewWidget = RobotViewWidget()
-        robotFrameLayout.addWidget(self.robotViewWidget)
-        rightLayout.addWidget(robotFrame, 1)
+        mainLayout.addWidget(self._wrapInPanel(self.robotViewWidget, "robotFrame"), 3, 3, 2, 1)
 
         # コントローラーウィジェット
-        controllerFrame = QFrame()
-        controllerFrame.setStyleSheet("""
-            QFrame {
-                background-color: #0A0A0A;
-                border: 1px solid #1A1A1A;
-                border-top: 2px solid #DC143C;
-            }
-        """)
-        controllerFrameLayout = QVBoxLayout(controllerFrame)
-        controllerFrameLayout.setContentsMargins(0, 0, 0, 0)
         self.controllerWidget = ControllerWidget()
-        controllerFrameLayout.addWidget(self.controllerWidget)
-        rightLayout.addWidget(controllerFrame, 1)
-
-        mainLayout.addWidget(rightPanel)
+        mainLayout.addWidget(self._wrapInPanel(self.controllerWidget, "controllerFrame"), 5, 3, 2, 1)
 
         # === 最右パネル（特殊動作） ===
-        actionsPanel = QFrame()
-        actionsPanel.setStyleSheet("""
-            QFrame {
-                background-color: #0A0A0A;
-                border: 1px solid #DC143C;
-            }
-        """)
-        actionsPanel.setFixedWidth(280)
-        actionsPanelLayout = QVBoxLayout(actionsPanel)
-        actionsPanelLayout.setContentsMargins(0, 0, 0, 0)
         self.actionsWidget = ActionsWidget()
-        actionsPanelLayout.addWidget(self.actionsWidget)
-        mainLayout.addWidget(actionsPanel)
+        actionsPanel = self._wrapInPanel(self.actionsWidget, "actionsPanel")
+        actionsPanel.setFixedWidth(280)
+        mainLayout.addWidget(actionsPanel, 0, 4, 7, 1)
+
+        # 伸縮: 中央の2列が横幅を、カメラ:下部 = 2:1 で縦幅を分け合う
+        mainLayout.setColumnStretch(1, 1)
+        mainLayout.setColumnStretch(2, 1)
+        for row in range(1, 7):
+            mainLayout.setRowStretch(row, 1)
+
+    def _wrapInPanel(self, widget: QWidget, objectName: str) -> QFrame:
+        """
+        ウィジェットを枠付きパネルで包む
+
+        枠のスタイルはmission.qssでオブジェクト名から指定する
+
+        Args:
+            widget: 中に配置するウィジェット
+            objectName: パネルのオブジェクト名
+
+        Returns:
+            QFrame: 作成したパネル
+        """
+        panel = QFrame()
+        panel.setObjectName(objectName)
+        layout = QVBoxLayout(panel)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(widget)
+        return panel
 
     def _setupShortcuts(self) -> None:
         """キーボードショートカットの設定"""
+        # ショートカットはボタンと同じシグナルへ直接つなぐ（シグナル間接続）
         # 緊急停止: Escape
         escapeShortcut = QShortcut(QKeySequence(Qt.Key_Escape), self)
-        escapeShortcut.activated.connect(self._onEmergencyStop)
+        escapeShortcut.activated.connect(self.statusWidget.emergencyStopClicked)
 
         # 立ち上がり: Space
         spaceShortcut = QShortcut(QKeySequence(Qt.Key_Space), self)
-        spaceShortcut.activated.connect(self.statusWidget.standUpClicked.emit)
+        spaceShortcut.activated.connect(self.statusWidget.standUpClicked)
 
         # 伏せる: D
         downShortcut = QShortcut(QKeySequence("D"), self)
-        downShortcut.activated.connect(self.statusWidget.standDownClicked.emit)
+        downShortcut.activated.connect(self.statusWidget.standDownClicked)
 
     def _setupStatusBar(self) -> None:
         """ステータスバーの設定"""
         statusBar = QStatusBar()
-        statusBar.setStyleSheet("""
-            QStatusBar {
-                background-color: #050505;
-                color: #404040;
-                border-top: 1px solid #1A1A1A;
-                font-size: 10px;
-                letter-spacing: 1px;
-            }
-        """)
         self.setStatusBar(statusBar)
 
         # 左側: ショートカットヒント
         hintLabel = QLabel("◆ ESC: ABORT  |  SPACE: DEPLOY  |  D: RETRACT")
-        hintLabel.setStyleSheet("color: #404040; padding: 4px;")
+        hintLabel.setObjectName("hintLabel")
         statusBar.addWidget(hintLabel)
 
         # 右側: バージョン
         versionLabel = QLabel("◆ TACTICAL INTERFACE v1.0")
-        versionLabel.setStyleSheet("color: #DC143C; padding: 4px;")
+        versionLabel.setObjectName("versionLabel")
         statusBar.addPermanentWidget(versionLabel)
 
     def _startClock(self) -> None:
         """時計の開始"""
+        # 秒の切り替わりに合わせて毎回単発で再設定する
         self._clockTimer = QTimer(self)
+        self._clockTimer.setSingleShot(True)
+        self._clockTimer.setTimerType(Qt.PreciseTimer)
         self._clockTimer.timeout.connect(self._updateClock)
-        self._clockTimer.start(1000)
         self._updateClock()
 
     def _updateClock(self) -> None:
         """時計を更新"""
-        from datetime import datetime
         now = datetime.now()
-        self.clockLabel.setText(now.strftime("%H:%M:%S"))
-        self.dateLabel.setText(now.strftime("%Y-%m-%d"))
+        # 次の秒の直後に起きる（少し早く起きた場合も同じ秒を描き直さない）
+        self._clockTimer.start(1000 - now.microsecond // 1000 + CLOCK_MARGIN_MS)
+
+        clockText = f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+        if clockText == self._lastClockText:
+            return
+        self._lastClockText = clockText
+        self.clockLabel.setText(clockText)
+
+        today = now.date()
+        if today != self._lastDate:
+            self._lastDate = today
+            self.dateLabel.setText(today.isoformat())
         
         # カメラのタイムスタンプも更新
-        self.cameraWidget.updateTimestamp(now.strftime("%H:%M:%S"))
+        if self.cameraWidget is not None:
+            self.cameraWidget.updateTimestamp(clockText)
+
+    def _pauseClock(self) -> None:
+        """時計を停止（ウィンドウが見えない間）"""
+        self._clockTimer.stop()
 
-    def _onEmergencyStop(self) -> None:
-        """緊急停止ショートカット"""
-        self.statusWidget.emergencyStopClicked.emit()
+    def _resumeClock(self) -> None:
+        """時計を再開（止まっていれば即時更新）"""
+        if not self._clockTimer.isActive():
+            self._updateClock()
 
     # === 外部からのUI更新メソッド ===
 
@@ -394,9 +318,19 @@ class MainWindow(QMainWindow):
     @Slot(object)
     def updateVideoFrame(self, frame) -> None:
         """映像フレームを更新"""
+        if self.cameraWidget is None:
+            self._createCameraWidget()
         self.cameraWidget.updateFrame(frame)
 
-    @Slot(bool, str, float, float, float, float, float, float, dict, bool, bool)
+    def _createCameraWidget(self) -> None:
+        """カメラウィジェットを作成してプレースホルダーと置き換える"""
+        self.cameraWidget = CameraWidget()
+        self.cameraWidget.updateTimestamp(self._lastClockText)
+        self._mainLayout.replaceWidget(self._cameraPlaceholder, self.cameraWidget)
+        self._cameraPlaceholder.deleteLater()
+        self._cameraPlaceholder = None
+
+    @Slot(bool, str, float, float, float, float, float, float, int, bool, bool)
     def updateControllerState(
         self,
         connected: bool,
@@ -407,16 +341,35 @@ class MainWindow(QMainWindow):
         rightY: float,
         lt: float,
         rt: float,
-        buttons: dict,
+        buttonsMask: int,
         leftPressed: bool,
         rightPressed: bool
     ) -> None:
         """コントローラー状態を更新"""
         self.controllerWidget.updateControllerState(
             connected, name, leftX, leftY, rightX, rightY,
-            lt, rt, buttons, leftPressed, rightPressed
+            lt, rt, buttonsMask, leftPressed, rightPressed
         )
 
+    def showEvent(self, event) -> None:
+        """ウィンドウ表示イベント"""
+        super().showEvent(event)
+        self._resumeClock()
+
+    def hideEvent(self, event) -> None:
+        """ウィンドウ非表示イベント"""
+        super().hideEvent(event)
+        self._pauseClock()
+
+    def changeEvent(self, event) -> None:
+        """ウィンドウ状態変更イベント（最小化中は時計を止める）"""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self._pauseClock()
+            elif self.isVisible():
+                self._resumeClock()
+
     def closeEvent(self, event) -> None:
         """ウィンドウクローズイベント"""
         reply = QMessageBox.question(
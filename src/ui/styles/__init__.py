@@ -5,13 +5,17 @@ QSSスタイルシートの読み込み
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=8)
 def loadStylesheet(name: str = "cyberpunk") -> str:
     """
     スタイルシートを読み込む
 
+    QSSはプロセス中に変わらないため、2回目以降はキャッシュした内容を返す
+
     Args:
         name: スタイルシート名（拡張子なし）
 
@@ -28,5 +32,12 @@ def loadStylesheet(name: str = "cyberpunk") -> str:
         return ""
 
 
-__all__ = ["loadStylesheet"]
+def clearStylesheetCache() -> None:
+    """
+    スタイルシートのキャッシュを破棄（QSS編集後の再読み込み用）
+    """
+    loadStylesheet.cache_clear()
+
+
+__all__ = ["loadStylesheet", "clearStylesheetCache"]
 
@@ -284,7 +284,7 @@ class ControllerWidget(QWidget):
         rightY: float = 0.0,
         lt: float = 0.0,
         rt: float = 0.0,
-        buttons: dict = None,
+        buttonsMask: int = 0,
         leftPressed: bool = False,
         rightPressed: bool = False
     ) -> None:
@@ -300,7 +300,7 @@ class ControllerWidget(QWidget):
             rightY: 右スティックY
             lt: 左トリガー (0-1)
             rt: 右トリガー (0-1)
-            buttons: ボタン状態辞書
+            buttonsMask: ボタン状態ビットマスク（ビットiがボタン番号i）
             leftPressed: 左スティック押し込み
             rightPressed: 右スティック押し込み
         """
@@ -336,7 +336,7 @@ class ControllerWidget(QWidget):
         self.rtBar.setValue(int(rt * 100))
 
         # ボタン
-        if buttons:
+        if connected:
             buttonMap = {
                 0: "A", 1: "B", 2: "X", 3: "Y",
                 4: "LB", 5: "RB", 6: "BACK", 7: "START"
@@ -344,7 +344,7 @@ class ControllerWidget(QWidget):
             for btnId, btnName in buttonMap.items():
                 if btnName in self.buttonLabels:
                     label, color = self.buttonLabels[btnName]
-                    pressed = buttons.get(btnId, False)
+                    pressed = buttonsMask & (1 << btnId)
                     if pressed:
                         label.setStyleSheet(f"""
                             background-color: {color};
@@ -259,9 +259,9 @@ class IMUWidget(QWidget):
         self._pitch = pitch
         self._yaw = yaw
         
-        if gyro:
+        if gyro is not None:
             self._gyro = gyro
-        if accel:
+        if accel is not None:
             self._accel = accel
 
         # 姿勢インジケーター更新
@@ -273,13 +273,13 @@ class IMUWidget(QWidget):
         self.yawLabel.setText(f"{yaw:+.1f}°")
 
         # 角速度ラベル更新
-        if gyro:
+        if gyro is not None:
             for i, label in enumerate(self.gyroLabels):
                 axis = ["X", "Y", "Z"][i]
                 label.setText(f"{axis}:{gyro[i]:+.2f}")
 
         # 加速度ラベル更新
-        if accel:
+        if accel is not None:
             for i, label in enumerate(self.accelLabels):
                 axis = ["X", "Y", "Z"][i]
                 label.setText(f"{axis}:{accel[i]:+.2f}")
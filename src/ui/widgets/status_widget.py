@@ -456,6 +456,7 @@ class StatusWidget(QWidget):
             self.emergencyBtn.setEnabled(False)
             
             self.modeLabel.setText("---")
+            self._mode = "---"
 
     def updateMode(self, mode: str) -> None:
         """
@@ -464,6 +465,9 @@ class StatusWidget(QWidget):
         Args:
             mode: 動作モード文字列
         """
+        # 状態受信ごとに呼ばれるため、変化がなければ再描画しない
+        if mode == self._mode:
+            return
         self._mode = mode
         self.modeLabel.setText(mode)
         